@@ -1,12 +1,49 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
+# Leaf marker inside trie nodes; paths are dotted field names, so a NUL
+# key can never collide with a real payload key.
+_LEAF = "\0"
+
+@lru_cache(maxsize=256)
+def _path_trie(paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Build a prefix trie from dotted required paths. Shared prefixes
+    (e.g. "odds.open" / "odds.close") are then walked once per payload
+    instead of once per path.
+    """
+    trie: Dict[str, Any] = {}
+    for p in paths:
+        node = trie
+        for part in p.split("."):
+            node = node.setdefault(part, {})
+        node[_LEAF] = p
+    return trie
+
+def _collect_missing(node: Dict[str, Any], value: Any, missing: set) -> None:
+    leaf = node.get(_LEAF)
+    if leaf is not None and value is None:
+        missing.add(leaf)
+    # `type(...) is dict` on purpose: hot loop, payloads are plain dicts.
+    is_dict = type(value) is dict
+    for part, child in node.items():
+        if part == _LEAF:
+            continue
+        _collect_missing(child, value.get(part) if is_dict else None, missing)
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    return tuple(path.split("."))
+
 def _get_path(obj: Dict[str, Any], path: str) -> Any:
     cur: Any = obj
-    for part in path.split("."):
-        if not isinstance(cur, dict) or part not in cur:
+    for part in _split_path(path):
+        if type(cur) is not dict:
+            return None
+        cur = cur.get(part)
+        if cur is None:
             return None
-        cur = cur[part]
     return cur
 
 def gate_check(
@@ -14,15 +51,13 @@ def gate_check(
     required_paths: List[str],
     pass_ratio: float = 0.65
 ) -> Tuple[bool, float, List[str]]:
-    missing: List[str] = []
-    present = 0
+    paths = tuple(required_paths)
+    missing_set: set = set()
+    _collect_missing(_path_trie(paths), payload, missing_set)
 
-    for p in required_paths:
-        if _get_path(payload, p) is None:
-            missing.append(p)
-        else:
-            present += 1
+    missing = [p for p in paths if p in missing_set]
+    present = len(paths) - len(missing)
 
     quality = present / max(1, len(required_paths))
     passed = quality >= pass_ratio
-    return passed, quality, missing
\ No newline at end of file
+    return passed, quality, missing
@@ -1,5 +1,6 @@
 # rebound_prop_gate.py
-from dataclasses import dataclass, asdict
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import json
@@ -10,14 +11,11 @@ import json
 # 🔒 70%+ : Lock it in everywhere
 # ⚠️ 60–69% : Boosts / ladder alt
 # 🟡 50–59% : One-book limit
+_TIER_BOUNDS = (0.50, 0.60, 0.70)
+_TIER_NAMES = ("NO_PLAY", "TIER_50", "TIER_60", "LOCK_70")
+
 def base_confidence_tier(win_prob: float) -> str:
-    if win_prob >= 0.70:
-        return "LOCK_70"
-    if win_prob >= 0.60:
-        return "TIER_60"
-    if win_prob >= 0.50:
-        return "TIER_50"
-    return "NO_PLAY"
+    return _TIER_NAMES[bisect_right(_TIER_BOUNDS, win_prob)]
 
 ADJUSTMENTS_PATH = Path("sharpedge/LIVEFLOW_TRIGGER_ADJUSTMENTS.json")
 OUTAGE_MODE_TAGS = {
@@ -34,7 +32,7 @@ def load_liveflow_adjustments(path: Path = ADJUSTMENTS_PATH) -> dict:
         return json.load(f)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReboundPropInput:
     player: str
     team: str
@@ -53,7 +51,7 @@ class ReboundPropInput:
     trigger_type: Optional[str] = None
     confidence_grade: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ReboundPropDecision:
     allowed: bool
     final_tier: str
@@ -94,6 +92,13 @@ TAG_PENALTIES = {
     },
 }
 
+# Frozen key view so hot paths can do one set intersection instead of
+# scanning tags_active once per penalty tag.
+TAG_PENALTY_KEYS = frozenset(TAG_PENALTIES)
+
+# Every tag the gate reacts to at all; anything else is a no-op pass-through.
+GATE_TAGS = TAG_PENALTY_KEYS | OUTAGE_MODE_TAGS
+
 # -----------------------------------------
 # Live-Flow rules (single-fire discipline)
 # -----------------------------------------
@@ -112,13 +117,13 @@ def apply_auto_adjustments(
     adj_edge: float,
     notes: List[str],
 ) -> Tuple[float, float, List[str]]:
+    if not OUTAGE_MODE_TAGS.intersection(set(inp.tags_active)):
+        return adj_wp, adj_edge, notes
+
     adjustments = load_liveflow_adjustments()
     trigger_adjustments = adjustments.get("trigger_adjustments", {})
     confidence_adjustments = adjustments.get("confidence_adjustments", {})
 
-    if not OUTAGE_MODE_TAGS.intersection(set(inp.tags_active)):
-        return adj_wp, adj_edge, notes
-
     trigger_name = inp.trigger_type or "UNSPECIFIED"
     confidence_name = inp.confidence_grade or "UNSPECIFIED"
 
@@ -192,7 +197,7 @@ def confidence_override(base_tier: str, tags_active: List[str], side: str, is_st
     overridden = False
     tier = base_tier
 
-    if (side.upper() == "OVER") and (is_starter_big is True) and any(t in tags_active for t in TAG_PENALTIES.keys()):
+    if (side.upper() == "OVER") and (is_starter_big is True) and not TAG_PENALTY_KEYS.isdisjoint(tags_active):
         # downgrade one step minimum
         if tier == "LOCK_70":
             tier = "TIER_60"
@@ -214,7 +219,7 @@ def liveflow_execution_gate(inp: ReboundPropInput, adj_wp: float, adj_edge: floa
     """
     blocks: List[str] = []
     is_starter_over = (inp.side.upper() == "OVER") and (inp.is_starter_big is True)
-    tags_on = any(t in inp.tags_active for t in TAG_PENALTIES.keys())
+    tags_on = not TAG_PENALTY_KEYS.isdisjoint(inp.tags_active)
 
     if is_starter_over and tags_on:
         req_wp = LIVEFLOW_BLOCKS["starter_over_min_winprob_with_tags"]
@@ -228,8 +233,8 @@ def liveflow_execution_gate(inp: ReboundPropInput, adj_wp: float, adj_edge: floa
         if adj_edge < req_edge:
             blocks.append(f"LiveFlow block: adj_edge {adj_edge:.4f} < required {req_edge:.4f} for starter REB OVER w/ volatility tags.")
 
-    adjustments = load_liveflow_adjustments()
     if OUTAGE_MODE_TAGS.intersection(set(inp.tags_active)):
+        adjustments = load_liveflow_adjustments()
         trigger_action = adjustments.get("trigger_adjustments", {}).get(inp.trigger_type or "UNSPECIFIED", {}).get("action")
         confidence_action = adjustments.get("confidence_adjustments", {}).get(inp.confidence_grade or "UNSPECIFIED", {}).get("action")
 
@@ -250,12 +255,30 @@ def evaluate_rebound_prop(inp: ReboundPropInput, mode: str = "PREGAME") -> Rebou
 
     base_tier = base_confidence_tier(inp.win_prob)
 
+    # Fast path: no penalty/outage tags active (the common case) means no
+    # adjustments, no overrides, and no adjustments-file read.
+    if GATE_TAGS.isdisjoint(inp.tags_active):
+        adj_wp = max(0.01, min(0.99, inp.win_prob))
+        allowed = base_tier != "NO_PLAY"
+        if not allowed:
+            blocks.append("Tier block: confidence tier = NO_PLAY after gate.")
+        return ReboundPropDecision(
+            allowed=allowed,
+            final_tier=base_tier,
+            tier_overridden=False,
+            adj_mean=inp.mean,
+            adj_median=inp.median,
+            adj_win_prob=adj_wp,
+            adj_edge=inp.edge,
+            blocks=blocks,
+            notes=[],
+            tags_applied=[],
+        )
+
     adj_mean, adj_median, adj_wp, adj_edge, tag_notes = apply_tag_penalties(inp)
     final_tier, overridden, override_reasons = confidence_override(base_tier, inp.tags_active, inp.side, inp.is_starter_big)
 
-    notes = []
-    notes.extend(tag_notes)
-    notes.extend(override_reasons)
+    notes = [*tag_notes, *override_reasons]
 
     allowed = True
     if mode.upper() == "LIVEFLOW":
@@ -296,6 +319,18 @@ def decision_to_log_dict(inp: ReboundPropInput, decision: ReboundPropDecision) -
         "tags_active": inp.tags_active,
         "trigger_type": inp.trigger_type,
         "confidence_grade": inp.confidence_grade,
-        "decision": asdict(decision),
+        # Flat literal instead of asdict(): no recursive field walk per log line.
+        "decision": {
+            "allowed": decision.allowed,
+            "final_tier": decision.final_tier,
+            "tier_overridden": decision.tier_overridden,
+            "adj_mean": decision.adj_mean,
+            "adj_median": decision.adj_median,
+            "adj_win_prob": decision.adj_win_prob,
+            "adj_edge": decision.adj_edge,
+            "blocks": decision.blocks,
+            "notes": decision.notes,
+            "tags_applied": decision.tags_applied,
+        },
     }
     return d
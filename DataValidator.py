@@ -1,7 +1,12 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Tuple
-from datetime import datetime
-from DataValidator import validate_dataset
+from functools import lru_cache
+
+try:
+    # Optional: columnar fast path for large datasets.
+    import pandas as pd
+except Exception:
+    pd = None
 
 REQUIRED = [
     "date","team_1","team_2","score_1","score_2",
@@ -10,11 +15,33 @@ REQUIRED = [
     "line_movement","outcome"
 ]
 
-def _is_date(s: str) -> bool:
-    try:
-        datetime.strptime(s, "%Y-%m-%d"); return True
-    except Exception:
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+@lru_cache(maxsize=4096)
+def _is_date_str(s: str) -> bool:
+    # Hand-rolled YYYY-MM-DD check; skips strptime's TimeRE machinery while
+    # keeping its semantics: real calendar days, leap years, exactly 4 year
+    # digits and 1-2 month/day digits (what %Y-%m-%d actually matches).
+    parts = s.split("-")
+    if len(parts) != 3:
+        return False
+    y, m, d = parts
+    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+        return False
+    if len(y) != 4 or len(m) > 2 or len(d) > 2:
+        return False
+    year, month, day = int(y), int(m), int(d)
+    if year < 1 or not 1 <= month <= 12:
         return False
+    max_day = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        max_day = 29
+    return 1 <= day <= max_day
+
+def _is_date(s) -> bool:
+    # Slates repeat the same handful of dates thousands of times; cache the
+    # strptime verdict per distinct string.
+    return isinstance(s, str) and _is_date_str(s)
 
 def _gt_one(x) -> bool:
     try:
@@ -34,6 +61,31 @@ def _nonneg_num(x) -> bool:
     except Exception:
         return False
 
+def _nonempty_str(x) -> bool:
+    return isinstance(x, str) and len(x.strip()) > 0
+
+def _binary(x) -> bool:
+    return x in (0, 1)
+
+# Precompiled (field, predicate, message) dispatch table; built once at
+# import so validate_record is a flat loop with no per-call setup.
+_FIELD_RULES = [
+    ("date", _is_date, "invalid date format (YYYY-MM-DD expected)"),
+    ("team_1", _nonempty_str, "team_1 must be non-empty string"),
+    ("team_2", _nonempty_str, "team_2 must be non-empty string"),
+    ("score_1", _nonneg_int, "score_1 must be integer >= 0"),
+    ("score_2", _nonneg_int, "score_2 must be integer >= 0"),
+    ("odds_open_team_1", _gt_one, "odds_open_team_1 must be a number > 1.0"),
+    ("odds_open_team_2", _gt_one, "odds_open_team_2 must be a number > 1.0"),
+    ("odds_close_team_1", _gt_one, "odds_close_team_1 must be a number > 1.0"),
+    ("odds_close_team_2", _gt_one, "odds_close_team_2 must be a number > 1.0"),
+    ("line_movement", _nonneg_num, "line_movement must be a number >= 0"),
+    ("outcome", _binary, "outcome must be 0 or 1"),
+]
+
+REQUIRED_FIELDS = frozenset(REQUIRED)
+ALLOWED = REQUIRED_FIELDS | {"injuries","weather_summary","venue","referee_id"}
+
 def validate_record(rec: Dict[str, Any]) -> Tuple[bool, List[str]]:
     errs: List[str] = []
 
@@ -41,36 +93,83 @@ def validate_record(rec: Dict[str, Any]) -> Tuple[bool, List[str]]:
         if k not in rec:
             errs.append(f"missing field: {k}")
 
-    if "date" in rec and not _is_date(rec["date"]):
-        errs.append("invalid date format (YYYY-MM-DD expected)")
+    for k, pred, msg in _FIELD_RULES:
+        if k in rec and not pred(rec[k]):
+            errs.append(msg)
+
+    extra = [k for k in rec.keys() if k not in ALLOWED]
+    if extra:
+        errs.append("unexpected fields: " + ", ".join(extra))
+
+    return (len(errs) == 0, errs)
+
+def _validate_dataset_columnar(records: List[Dict[str, Any]]) -> List[List[str]]:
+    """
+    Columnar pass over the whole dataset with pandas.
+
+    Mirrors validate_record rule-for-rule (same messages, same order) but
+    runs each rule once per column instead of once per row. The quirky
+    helpers (_nonneg_int, string checks) are applied via .map so their
+    edge-case semantics stay identical to the row path.
+    """
+    df = pd.DataFrame.from_records(records)
+    errs: List[List[str]] = [[] for _ in range(len(records))]
+
+    def flag(mask, msg: str) -> None:
+        for i in mask.to_numpy().nonzero()[0]:
+            errs[i].append(msg)
+
+    has = {k: pd.Series([k in r for r in records]) for k in REQUIRED}
+
+    for k in REQUIRED:
+        flag(~has[k], f"missing field: {k}")
+
+    if "date" in df.columns:
+        parsed = pd.to_datetime(df["date"].where(df["date"].map(lambda v: isinstance(v, str))),
+                                format="%Y-%m-%d", errors="coerce")
+        flag(has["date"] & parsed.isna(), "invalid date format (YYYY-MM-DD expected)")
 
     for k in ("team_1","team_2"):
-        if k in rec and (not isinstance(rec[k], str) or len(rec[k].strip()) == 0):
-            errs.append(f"{k} must be non-empty string")
+        if k in df.columns:
+            ok = df[k].map(_nonempty_str)
+            flag(has[k] & ~ok, f"{k} must be non-empty string")
 
     for k in ("score_1","score_2"):
-        if k in rec and not _nonneg_int(rec[k]):
-            errs.append(f"{k} must be integer >= 0")
+        if k in df.columns:
+            ok = df[k].map(_nonneg_int)
+            flag(has[k] & ~ok, f"{k} must be integer >= 0")
 
     for k in ("odds_open_team_1","odds_open_team_2","odds_close_team_1","odds_close_team_2"):
-        if k in rec and not _gt_one(rec[k]):
-            errs.append(f"{k} must be a number > 1.0")
+        if k in df.columns:
+            ok = pd.to_numeric(df[k], errors="coerce") > 1.0
+            flag(has[k] & ~ok, f"{k} must be a number > 1.0")
 
-    if "line_movement" in rec and not _nonneg_num(rec["line_movement"]):
-        errs.append("line_movement must be a number >= 0")
+    if "line_movement" in df.columns:
+        ok = pd.to_numeric(df["line_movement"], errors="coerce") >= 0.0
+        flag(has["line_movement"] & ~ok, "line_movement must be a number >= 0")
 
-    if "outcome" in rec and rec["outcome"] not in (0,1):
-        errs.append("outcome must be 0 or 1")
+    if "outcome" in df.columns:
+        ok = df["outcome"].isin([0,1])
+        flag(has["outcome"] & ~ok, "outcome must be 0 or 1")
 
-    allowed = set(REQUIRED) | {"injuries","weather_summary","venue","referee_id"}
-    extra = [k for k in rec.keys() if k not in allowed]
-    if extra:
-        errs.append("unexpected fields: " + ", ".join(extra))
+    for i, r in enumerate(records):
+        extra = [k for k in r.keys() if k not in ALLOWED]
+        if extra:
+            errs[i].append("unexpected fields: " + ", ".join(extra))
 
-    return (len(errs) == 0, errs)
+    return errs
 
 def validate_dataset(records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     good, bad = [], []
+    if pd is not None and records:
+        all_errs = _validate_dataset_columnar(records)
+        for i, (r, errs) in enumerate(zip(records, all_errs), start=1):
+            if errs:
+                bad.append({"row": i, "errors": errs, "record": r})
+            else:
+                good.append(r)
+        return good, bad
+
     for i, r in enumerate(records, start=1):
         ok, errs = validate_record(r)
         if ok:
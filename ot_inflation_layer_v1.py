@@ -1,4 +1,5 @@
 # ot_inflation_layer_v1.py
+import math
 from dataclasses import dataclass
 
 @dataclass
@@ -9,21 +10,24 @@ class OTConfig:
     POINTS_PER_POSS: float = 1.08           # league OT baseline
     POINTS_VAR: float = 0.10                # scoring variance multiplier
 
-def apply_ot_inflation(game_ctx: dict, num_ot: int, cfg: OTConfig = OTConfig()):
+@dataclass(slots=True)
+class GameCtx:
+    """Typed game context (replaces the old loose dict contract)."""
+    pred_total_median: float = 0.0
+    pred_total_sigma: float = 12.0
+    possessions_per_team: float = 0.0
+    ot_inflation_applied: bool = False
+    num_ot: int = 0
+
+def apply_ot_inflation(game_ctx: GameCtx, num_ot: int, cfg: OTConfig = OTConfig()):
     """
-    game_ctx expects:
-      - 'pred_total_median'
-      - 'pred_total_sigma' (optional)
-      - 'possessions_per_team' (optional)
-    Returns updated game_ctx.
+    Mutates and returns game_ctx (a GameCtx).
     """
     if not cfg.ENABLED or num_ot <= 0:
         return game_ctx
 
-    import math
-
-    base_total = game_ctx.get("pred_total_median", 0.0)
-    base_sigma = game_ctx.get("pred_total_sigma", 12.0)
+    base_total = game_ctx.pred_total_median
+    base_sigma = game_ctx.pred_total_sigma
 
     # possessions added
     poss_add_per_team = cfg.BASE_POSSESSIONS_PER_OT + cfg.POSSESSIONS_VAR * (num_ot - 1)
@@ -33,8 +37,26 @@ def apply_ot_inflation(game_ctx: dict, num_ot: int, cfg: OTConfig = OTConfig()):
     extra_points_mean = total_extra_poss * cfg.POINTS_PER_POSS
     extra_points_sigma = extra_points_mean * cfg.POINTS_VAR
 
-    game_ctx["pred_total_median"] = base_total + extra_points_mean
-    game_ctx["pred_total_sigma"] = math.sqrt(base_sigma**2 + extra_points_sigma**2)
-    game_ctx["ot_inflation_applied"] = True
-    game_ctx["num_ot"] = num_ot
-    return game_ctx
\ No newline at end of file
+    game_ctx.pred_total_median = base_total + extra_points_mean
+    game_ctx.pred_total_sigma = math.sqrt(base_sigma**2 + extra_points_sigma**2)
+    game_ctx.ot_inflation_applied = True
+    game_ctx.num_ot = num_ot
+    return game_ctx
+
+
+def ot_inflation_curve(num_ots, cfg: OTConfig = OTConfig()):
+    """
+    Vectorized form: extra-points (mean, sigma) arrays for a whole batch
+    of OT counts at once (e.g. every simulated game in a backtest).
+    Entries with num_ot <= 0 (or the layer disabled) come back as zeros.
+    """
+    import numpy as np
+
+    n = np.asarray(num_ots, dtype=float)
+    poss_add_per_team = cfg.BASE_POSSESSIONS_PER_OT + cfg.POSSESSIONS_VAR * (n - 1)
+    extra_points_mean = 2.0 * poss_add_per_team * n * cfg.POINTS_PER_POSS
+
+    live = (n > 0) if cfg.ENABLED else np.zeros_like(n, dtype=bool)
+    extra_points_mean = np.where(live, extra_points_mean, 0.0)
+    extra_points_sigma = extra_points_mean * cfg.POINTS_VAR
+    return extra_points_mean, extra_points_sigma
\ No newline at end of file
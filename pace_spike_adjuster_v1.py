@@ -31,21 +31,55 @@ class PaceSpikeAdjusterV1:
             4: 0.15,   # Q4 spike dampener
             "OT": 0.20 # OT spike dampener
         }
+        self.run_damp = 0.12  # scoring-run dampener
+
+        # Derived multipliers, precomputed so the per-call path multiplies
+        # constants instead of re-deriving (1 - penalty) every game tick.
+        self._quarter_factor = {q: 1.0 - p for q, p in self.quarter_spike_penalty.items()}
+        self._run_factor = 1.0 - self.run_damp
 
     def detect_scoring_run(self, scoring_sequence):
         """
         scoring_sequence: list of possession outcomes (+1, +2, +3, +0)
         Returns True if either team has a run >= run_threshold.
         """
+        threshold = self.run_threshold  # local bind for the tight loop
         current = 0
         for pts in scoring_sequence:
             current += pts
-            if current >= self.run_threshold:
+            if current >= threshold:
                 return True
             if pts <= 0:
                 current = 0
         return False
 
+    def detect_scoring_runs_batch(self, scoring_sequences):
+        """
+        Vectorized detect_scoring_run over a (n_sims, n_possessions) matrix
+        of outcomes (+0/+1/+2/+3). Returns a boolean array per simulation.
+
+        Uses the cumsum-minus-last-reset trick: the running total at each
+        possession equals the cumulative sum minus the cumulative sum at the
+        most recent scoreless possession before it.
+        """
+        import numpy as np
+
+        seqs = np.asarray(scoring_sequences, dtype=float)
+        if seqs.ndim == 1:
+            seqs = seqs[None, :]
+        if seqs.shape[1] == 0:
+            return np.zeros(seqs.shape[0], dtype=bool)
+
+        cs = np.cumsum(seqs, axis=1)
+        resets = np.where(seqs <= 0, cs, 0.0)
+        offset = np.maximum.accumulate(resets, axis=1)
+        # the check fires before the reset at the same index, so shift by one
+        offset_prev = np.concatenate(
+            [np.zeros((seqs.shape[0], 1)), offset[:, :-1]], axis=1
+        )
+        current = cs - offset_prev
+        return (current >= self.run_threshold).any(axis=1)
+
     def apply_transition_dampen(self, baseline_transition_rate, observed_rate):
         """
         Dampens transition-based pace inflation when it exceeds threshold.
@@ -65,18 +99,19 @@ class PaceSpikeAdjusterV1:
         Main adjustment pipeline.
         """
         damp_factor = 1.0
+        quarter_factor = self._quarter_factor
 
         # OT inflation first
         if is_overtime:
-            damp_factor *= (1 - self.quarter_spike_penalty["OT"])
+            damp_factor *= quarter_factor["OT"]
 
         # Q3 / Q4 dampen rules
-        if quarter in self.quarter_spike_penalty:
-            damp_factor *= (1 - self.quarter_spike_penalty[quarter])
+        if quarter in quarter_factor:
+            damp_factor *= quarter_factor[quarter]
 
         # scoring run detection damp
         if self.detect_scoring_run(scoring_sequence):
-            damp_factor *= (1 - 0.12)
+            damp_factor *= self._run_factor
 
         # transition spike damp
         trans_damp = self.apply_transition_dampen(
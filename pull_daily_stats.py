@@ -1,15 +1,35 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 import requests
+from lxml import html as lxml_html
 
 TODAY = date.today().strftime("%Y-%m-%d")
+CURRENT_YEAR = date.today().year
+
+def first_table_df(url: str) -> pd.DataFrame:
+    """
+    Fetch url and parse only the first <table> into a DataFrame.
+    pd.read_html parses every table on the page; these pages only need
+    the first one, so go straight at it with lxml.
+    """
+    resp = requests.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
+    resp.raise_for_status()
+    table = lxml_html.fromstring(resp.content).find(".//table")
+    if table is None:
+        raise ValueError(f"No table found at {url}")
+    rows = [
+        [cell.text_content().strip() for cell in tr.findall("./th") + tr.findall("./td")]
+        for tr in table.findall(".//tr")
+    ]
+    rows = [r for r in rows if r]
+    return pd.DataFrame(rows[1:], columns=rows[0])
 
 # --- Baseball-Reference ---
 def pull_baseball_reference():
     print("⏳ Pulling Baseball-Reference standings …")
-    url = "https://www.baseball-reference.com/leagues/majors/{}.shtml".format(date.today().year)
-    tables = pd.read_html(url)
-    tables[0].to_csv(f"data/raw/mlb/br_standings_{TODAY}.csv", index=False)
+    url = "https://www.baseball-reference.com/leagues/majors/{}.shtml".format(CURRENT_YEAR)
+    first_table_df(url).to_csv(f"data/raw/mlb/br_standings_{TODAY}.csv", index=False)
     print("✅ Saved Baseball-Reference standings")
 
 # --- FanGraphs ---
@@ -17,12 +37,14 @@ def pull_fangraphs():
     print("⏳ Pulling FanGraphs team stats …")
     url = (
         "https://www.fangraphs.com/leaders.aspx?"
-        f"pos=all&stats=bat&lg=all&qual=0&type=8&season={date.today().year}&month=0&team=0,ts"
+        f"pos=all&stats=bat&lg=all&qual=0&type=8&season={CURRENT_YEAR}&month=0&team=0,ts"
     )
-    dfs = pd.read_html(url)
-    dfs[0].to_csv(f"data/raw/mlb/fangraphs_team_{TODAY}.csv", index=False)
+    first_table_df(url).to_csv(f"data/raw/mlb/fangraphs_team_{TODAY}.csv", index=False)
     print("✅ Saved FanGraphs team stats")
 
 if __name__ == "__main__":
-    pull_baseball_reference()
-    pull_fangraphs()
+    # The two pulls hit unrelated hosts; overlap their network waits.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(pull_baseball_reference), pool.submit(pull_fangraphs)]
+    for fut in futures:
+        fut.result()
@@ -1,4 +1,10 @@
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import numpy as np
+except Exception:
+    np = None
 
 @dataclass
 class RebConfig:
@@ -9,11 +15,27 @@ class RebConfig:
     FOUL_RISK_DAMP: float = 0.10
 
 
+@lru_cache(maxsize=512)
+def _pace_ratio(poss_per_team: float, pace_ref: float, elasticity: float) -> float:
+    # Pace repeats across every player in a game, so the fractional pow --
+    # by far the costliest op here -- amortizes to a dict hit.
+    return (poss_per_team / pace_ref) ** elasticity
+
 def dynamic_reb_chances(base_chances, poss_per_team, long_reb_share, foul_gate_on, cfg: RebConfig):
-    """Compute rebound chances adjusted for pace, shot mix, and foul risk."""
+    """Compute rebound chances adjusted for pace, shot mix, and foul risk.
+
+    Broadcasts like a ufunc: every argument may be a scalar or a NumPy
+    array (per team / per sim), including the foul gate.
+    """
     if not cfg.ENABLED:
         return base_chances
-    pace_ratio = (poss_per_team / cfg.PACE_REF) ** cfg.PACE_ELASTICITY
+    if np is not None and isinstance(poss_per_team, np.ndarray):
+        pace_ratio = (poss_per_team / cfg.PACE_REF) ** cfg.PACE_ELASTICITY
+    else:
+        pace_ratio = _pace_ratio(poss_per_team, cfg.PACE_REF, cfg.PACE_ELASTICITY)
     mix_boost = 1.0 + cfg.SHOT_MIX_WEIGHT * (long_reb_share - 0.35)
-    foul_damp = (1.0 - cfg.FOUL_RISK_DAMP) if foul_gate_on else 1.0
-    return base_chances * pace_ratio * mix_boost * foul_damp 
\ No newline at end of file
+    if np is not None and isinstance(foul_gate_on, np.ndarray):
+        foul_damp = np.where(foul_gate_on, 1.0 - cfg.FOUL_RISK_DAMP, 1.0)
+    else:
+        foul_damp = (1.0 - cfg.FOUL_RISK_DAMP) if foul_gate_on else 1.0
+    return base_chances * pace_ratio * mix_boost * foul_damp
\ No newline at end of file
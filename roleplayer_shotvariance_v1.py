@@ -1,6 +1,16 @@
 # roleplayer_shotvariance_v1.py
+import random
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# Single module-level RNG: no per-call import, and deterministic runs can
+# still inject their own rng.
+_DEFAULT_RNG = random.Random()
+
 @dataclass
 class RPVConfig:
     ENABLED: bool = True
@@ -10,43 +20,72 @@ class RPVConfig:
     EFF_MULT: float = 1.10              # 10% bump to FG%/3P%
     MAX_SPIKE_ROLE_USG: float = 0.24    # avoid turning them into stars
 
-def apply_roleplayer_variance(player_ctx: dict, cfg: RPVConfig = RPVConfig(), rng=None):
+@dataclass(slots=True)
+class PlayerCtx:
+    """Typed player context (replaces the old loose dict contract)."""
+    role: str = "role"             # 'bench'/'role'/'star'
+    usage_rate: float = 0.18       # 0-1
+    fg_pct: float = 0.45           # 0-1
+    three_pt_pct: float = 0.35     # 0-1
+    rpv_spike_flag: bool = False
+
+def apply_roleplayer_variance(player_ctx: PlayerCtx, cfg: RPVConfig = RPVConfig(), rng=None, draws=None):
     """
-    player_ctx expects:
-      - 'role': 'bench'/'role'/'star'
-      - 'usage_rate' (0–1)
-      - 'fg_pct' (0–1)
-      - 'three_pt_pct' (0–1)
-    Returns updated player_ctx.
+    Mutates and returns player_ctx (a PlayerCtx).
+    `draws` may carry a pre-drawn (usage, efficiency) uniform pair so batch
+    callers can roll the RNG once for a whole roster.
     """
     if not cfg.ENABLED:
         return player_ctx
 
-    if player_ctx.get("role") not in ("bench", "role"):
+    if player_ctx.role not in ("bench", "role"):
         return player_ctx
 
-    import random
-    r = rng or random
+    if draws is None:
+        r = rng or _DEFAULT_RNG
+        draws = (r.random(), r.random())
+    usage_draw, eff_draw = draws
 
-    usage = player_ctx.get("usage_rate", 0.18)
-    fg = player_ctx.get("fg_pct", 0.45)
-    tp = player_ctx.get("three_pt_pct", 0.35)
+    usage = player_ctx.usage_rate
+    fg = player_ctx.fg_pct
+    tp = player_ctx.three_pt_pct
 
     spike_used = False
 
     # Usage spike
-    if r.random() < cfg.USAGE_SPIKE_PROB:
+    if usage_draw < cfg.USAGE_SPIKE_PROB:
         usage = min(usage * cfg.USAGE_MULT, cfg.MAX_SPIKE_ROLE_USG)
         spike_used = True
 
     # Efficiency spike
-    if r.random() < cfg.EFF_SPIKE_PROB:
+    if eff_draw < cfg.EFF_SPIKE_PROB:
         fg = min(fg * cfg.EFF_MULT, 0.70)
         tp = min(tp * cfg.EFF_MULT, 0.60)
         spike_used = True
 
-    player_ctx["usage_rate"] = usage
-    player_ctx["fg_pct"] = fg
-    player_ctx["three_pt_pct"] = tp
-    player_ctx["rpv_spike_flag"] = spike_used
-    return player_ctx
\ No newline at end of file
+    player_ctx.usage_rate = usage
+    player_ctx.fg_pct = fg
+    player_ctx.three_pt_pct = tp
+    player_ctx.rpv_spike_flag = spike_used
+    return player_ctx
+
+def apply_roleplayer_variance_batch(players, cfg: RPVConfig = RPVConfig(), rng=None):
+    """
+    Apply variance to a whole roster with a single bulk RNG draw
+    (one (n, 2) uniform matrix) instead of two draws per player.
+    `rng` is a numpy Generator when numpy is available, else a
+    random.Random-compatible object.
+    """
+    if not cfg.ENABLED or not players:
+        return players
+
+    if np is not None:
+        draws = (rng or np.random.default_rng()).random((len(players), 2))
+        draw_pairs = ((float(u), float(e)) for u, e in draws)
+    else:
+        r = rng or _DEFAULT_RNG
+        draw_pairs = ((r.random(), r.random()) for _ in players)
+
+    for player_ctx, pair in zip(players, draw_pairs):
+        apply_roleplayer_variance(player_ctx, cfg, draws=pair)
+    return players
@@ -1,17 +1,64 @@
 import sys, shutil, os, pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 DEFAULT_SRC = "templates/api_runner"
 DEFAULT_DST = "."
 
-def copy_tree(src, dst):
+def _kernel_copy(fsrc_fd, fdst_fd, size):
+    # copy_file_range can stay fully in-kernel (and reflink on supporting
+    # filesystems); sendfile is the older zero-copy path.
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        while copied < size:
+            n = os.copy_file_range(fsrc_fd, fdst_fd, size - copied)
+            if n == 0:
+                break
+            copied += n
+        return copied
+    while copied < size:
+        n = os.sendfile(fdst_fd, fsrc_fd, copied, size - copied)
+        if n == 0:
+            break
+        copied += n
+    return copied
+
+def _copy_file(src, dst):
+    # Zero-copy kernel path where available; falls back to a buffered copy.
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            _kernel_copy(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+def copy_tree(src, dst, max_workers=8):
     src = pathlib.Path(src)
     dst = pathlib.Path(dst)
-    for root, dirs, files in os.walk(src):
-        rel = pathlib.Path(root).relative_to(src)
-        dest_dir = dst / rel
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        for file in files:
-            shutil.copy2(pathlib.Path(root) / file, dest_dir / file)
+    dst.mkdir(parents=True, exist_ok=True)
+
+    # Scandir pass first: create directories up front, queue file copies,
+    # then fan the copies out over a thread pool.
+    file_pairs = []
+    stack = [(src, dst)]
+    while stack:
+        cur_src, cur_dst = stack.pop()
+        with os.scandir(cur_src) as entries:
+            for entry in entries:
+                target = cur_dst / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    target.mkdir(exist_ok=True)
+                    stack.append((pathlib.Path(entry.path), target))
+                else:
+                    file_pairs.append((entry.path, target))
+
+    if file_pairs:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_pairs))) as pool:
+            futures = [pool.submit(_copy_file, s, t) for s, t in file_pairs]
+        for fut in futures:
+            fut.result()
 
 if __name__ == "__main__":
     src = sys.argv[1] if len(sys.argv) >= 2 else DEFAULT_SRC
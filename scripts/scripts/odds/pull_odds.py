@@ -6,7 +6,27 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    # Optional: columnar flatten for big snapshots (workflow runners that
+    # only install requests fall back to the nested loop).
+    import pandas as pd
+except Exception:
+    pd = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+# Pooled session: Airtable upserts go out in many small batches and the
+# odds pull hits the same host, so keep-alive connections get reused.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
 
 # -----------------------------
 # Config (ENV)
@@ -38,6 +58,11 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# One clock read per run: meta, snapshot name, and every Airtable row share
+# the same snapshot moment instead of re-formatting the clock repeatedly.
+RUN_TS_UTC = utc_now_iso()
+
+
 def must_env(name: str, value: str) -> None:
     if not value:
         raise RuntimeError(f"Missing required env var: {name}")
@@ -71,6 +96,22 @@ def american_to_implied_prob(odds: Optional[float]) -> Optional[float]:
         return (-odds) / ((-odds) + 100.0)
 
 
+def american_to_implied_prob_array(odds):
+    """
+    Vectorized american_to_implied_prob over an array/Series of prices.
+    Invalid, zero, or missing odds come back as NaN.
+    """
+    import numpy as np
+
+    if pd is not None:
+        odds = pd.to_numeric(pd.Series(odds), errors="coerce")
+    o = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        implied = np.where(o > 0, 100.0 / (o + 100.0), (-o) / ((-o) + 100.0))
+    implied[~np.isfinite(o) | (o == 0)] = np.nan
+    return implied
+
+
 # -----------------------------
 # Odds Pull (The Odds API format)
 # -----------------------------
@@ -91,11 +132,16 @@ def fetch_odds() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         "dateFormat": DATE_FORMAT,
     }
 
-    r = requests.get(url, params=params, timeout=20)
+    # Retry transient provider hiccups (rate limits / 5xx) with backoff.
+    for attempt in range(3):
+        r = SESSION.get(url, params=params, timeout=20)
+        if r.status_code == 200 or (r.status_code != 429 and r.status_code < 500):
+            break
+        time.sleep(0.5 * (2 ** attempt))
     meta = {
         "status_code": r.status_code,
         "url": r.url,
-        "pulled_at_utc": utc_now_iso(),
+        "pulled_at_utc": RUN_TS_UTC,
     }
 
     if r.status_code != 200:
@@ -113,11 +159,81 @@ def fetch_odds() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
 # -----------------------------
 # Normalize → ODDS_SNAPSHOTS rows
 # -----------------------------
+def _normalize_rows_columnar(events: List[Dict[str, Any]], snapshot_ts: str) -> List[Dict[str, Any]]:
+    """
+    Flatten the 4-level provider payload in one pd.json_normalize pass,
+    then emit Airtable rows from the flat frame.
+    """
+    df = pd.json_normalize(
+        events,
+        record_path=["bookmakers", "markets", "outcomes"],
+        meta=[
+            "id", "sport_key", "sport_title", "commence_time",
+            "home_team", "away_team",
+            ["bookmakers", "key"], ["bookmakers", "title"], ["bookmakers", "last_update"],
+            ["bookmakers", "markets", "key"],
+        ],
+        errors="ignore",
+    )
+    for col in ("name", "price", "point"):
+        if col not in df.columns:
+            df[col] = None
+    # astype(object) first: on float64 columns a bare .where(...) coerces
+    # None straight back to NaN, which would leak into the Airtable rows
+    # (and stdlib json serializes NaN as invalid JSON).
+    df = df.astype(object).where(df.notna(), None)
+
+    rows: List[Dict[str, Any]] = []
+    for rec in df.to_dict("records"):
+        name = rec.get("name")
+        price = rec.get("price")
+        point = rec.get("point")
+        market_key = rec.get("bookmakers.markets.key")
+
+        implied = american_to_implied_prob(price) if ODDS_FORMAT == "american" else None
+        selection = name
+        # NaN-safe gate: a spreads/totals outcome without a point must not
+        # format as "Over nan".
+        if market_key in ("spreads", "totals") and point is not None and not pd.isna(point):
+            selection = f"{name} {point}"
+
+        rows.append({
+            "fields": {
+                "snapshot_ts_utc": snapshot_ts,
+                "event_id": rec.get("id"),
+                "sport_key": rec.get("sport_key"),
+                "sport_title": rec.get("sport_title"),
+                "commence_time": rec.get("commence_time"),
+                "home_team": rec.get("home_team"),
+                "away_team": rec.get("away_team"),
+                "book_key": rec.get("bookmakers.key"),
+                "book_title": rec.get("bookmakers.title"),
+                "book_last_update": rec.get("bookmakers.last_update"),
+                "market": market_key,
+                "selection": selection,
+                "outcome_name": name,
+                "line": point,
+                "odds": price,
+                "implied_prob": implied,
+            }
+        })
+    return rows
+
+
 def normalize_to_rows(events: List[Dict[str, Any]], snapshot_ts: str) -> List[Dict[str, Any]]:
     """
     Converts provider payload into Airtable-ready rows.
     One row per (event, bookmaker, market, outcome/side).
     """
+    if pd is not None:
+        try:
+            return _normalize_rows_columnar(events, snapshot_ts)
+        except KeyError:
+            # json_normalize requires every event to carry the full
+            # bookmakers/markets/outcomes path; odd payloads fall back to
+            # the tolerant row-by-row walk below.
+            pass
+
     rows: List[Dict[str, Any]] = []
 
     for ev in events:
@@ -209,7 +325,10 @@ def airtable_create_records(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     for i in range(0, len(rows), batch_size):
         batch = rows[i : i + batch_size]
         payload = {"records": batch}
-        resp = requests.post(url, headers=headers, json=payload, timeout=25)
+        if orjson is not None:
+            resp = SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=25)
+        else:
+            resp = SESSION.post(url, headers=headers, json=payload, timeout=25)
         
         print("Airtable status:", resp.status_code)
         print("Airtable response:", resp.text[:500])
@@ -242,7 +361,7 @@ def main() -> None:
     must_env("AIRTABLE_BASE_ID", AIRTABLE_BASE_ID)
     must_env("AIRTABLE_ODDS_TABLE_ID", AIRTABLE_ODDS_TABLE_ID)
 
-    snapshot_ts = utc_now_iso()
+    snapshot_ts = RUN_TS_UTC
 
     events, meta = fetch_odds()
 
@@ -250,8 +369,28 @@ def main() -> None:
     try:
         mkdir_p(SNAPSHOT_DIR)
         raw_path = os.path.join(SNAPSHOT_DIR, f"odds_raw_{snapshot_ts.replace(':','-')}.json")
-        with open(raw_path, "w", encoding="utf-8") as f:
-            json.dump({"meta": meta, "events": events}, f, ensure_ascii=False, indent=2)
+        # Stream one event at a time so the snapshot never needs the whole
+        # payload serialized in memory at once.
+        if orjson is not None:
+            with open(raw_path, "wb") as f:
+                f.write(b'{"meta": ')
+                f.write(orjson.dumps(meta))
+                f.write(b', "events": [')
+                for i, ev in enumerate(events):
+                    if i:
+                        f.write(b",")
+                    f.write(orjson.dumps(ev))
+                f.write(b"]}")
+        else:
+            with open(raw_path, "w", encoding="utf-8") as f:
+                f.write('{"meta": ')
+                json.dump(meta, f, ensure_ascii=False)
+                f.write(', "events": [')
+                for i, ev in enumerate(events):
+                    if i:
+                        f.write(",")
+                    json.dump(ev, f, ensure_ascii=False)
+                f.write("]}")
         print(f"[OK] Wrote raw snapshot: {raw_path}")
     except Exception as e:
         print(f"[WARN] Failed writing raw snapshot: {e}")
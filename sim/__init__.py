@@ -1 +1,10 @@
- 
\ No newline at end of file
+"""Shared sim-wide helpers.
+
+clamp lives in mlb_stabilizer (which must stay loadable as a standalone
+file by the controller's engine fallback) and is re-exported here for the
+pace/totals modules.
+"""
+
+from .mlb_stabilizer import clamp
+
+__all__ = ["clamp"]
@@ -1,17 +1,27 @@
 import math
 import statistics
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+def clamp(value, low, high):
+    """Branchless bound via a min/max pair (no conditionals)."""
+    return max(low, min(value, high))
+
 def apply_static_stabilizers(ctx):
     """Master stabilizer call."""
     cfg = ctx.get("config", {}).get("stabilizer", {})
     if not cfg.get("enabled", True):
         return ctx
 
-    ctx = inning_cluster_dampener(ctx, cfg)
-    ctx = relief_chain_normalizer(ctx, cfg)
-    ctx = hr_spike_flag(ctx, cfg)
-    ctx = umpire_bounds(ctx, cfg)
-    ctx = lineup_uncertainty(ctx, cfg)
+    # Fused pass: the enabled flags are resolved here in one sweep so
+    # disabled stabilizers cost nothing (no call, no ctx re-traversal).
+    for cfg_key, stabilizer in STABILIZER_CHAIN:
+        if cfg.get(cfg_key, {}).get("enabled", True):
+            ctx = stabilizer(ctx, cfg)
     return ctx
 
 
@@ -21,9 +31,17 @@ def inning_cluster_dampener(ctx, cfg):
     q_lo, q_hi = 0.08, 0.92
     run_env = ctx.get("run_env", {})
     runs = run_env.get("inning_run_dist", [0,1,2,3,4,5])
-    floor = statistics.quantiles(runs, n=100)[int(q_lo*100)]
-    cap = statistics.quantiles(runs, n=100)[int(q_hi*100)]
-    clamped = [min(max(r, floor), cap) for r in runs]
+    if np is not None:
+        # method="weibull" with the +0.01-shifted cut points reproduces
+        # statistics.quantiles(n=100)[8]/[92] exactly (cut index k is the
+        # (k+1)/100 exclusive quantile), so sim output does not depend on
+        # whether the optional numpy is installed.
+        floor, cap = np.quantile(runs, [q_lo + 0.01, q_hi + 0.01], method="weibull")
+        clamped = np.clip(runs, floor, cap).tolist()
+    else:
+        cuts = statistics.quantiles(runs, n=100)
+        floor, cap = cuts[int(q_lo*100)], cuts[int(q_hi*100)]
+        clamped = [clamp(r, floor, cap) for r in runs]
     run_env["inning_run_dist"] = clamped
     ctx["run_env"] = run_env
     return ctx
@@ -34,7 +52,7 @@ def relief_chain_normalizer(ctx, cfg):
         return ctx
     bullpen = ctx.get("bullpen", {})
     for role, data in bullpen.items():
-        data["ip"] = min(max(data.get("ip", 1.0), 0.1), 3.0)
+        data["ip"] = clamp(data.get("ip", 1.0), 0.1, 3.0)
     ctx["bullpen"] = bullpen
     return ctx
 
@@ -57,8 +75,8 @@ def umpire_bounds(ctx, cfg):
         return ctx
     capK = cfg["umpire_bounds"].get("k_rate_delta_cap", 0.015)
     capB = cfg["umpire_bounds"].get("bb_rate_delta_cap", 0.010)
-    ctx["k_rate_delta"] = max(-capK, min(ctx.get("k_rate_delta", 0.0), capK))
-    ctx["bb_rate_delta"] = max(-capB, min(ctx.get("bb_rate_delta", 0.0), capB))
+    ctx["k_rate_delta"] = clamp(ctx.get("k_rate_delta", 0.0), -capK, capK)
+    ctx["bb_rate_delta"] = clamp(ctx.get("bb_rate_delta", 0.0), -capB, capB)
     return ctx
 
 
@@ -66,12 +84,33 @@ def lineup_uncertainty(ctx, cfg):
     if not cfg.get("lineup_uncertainty", {}).get("enabled", True):
         return ctx
     lineup = ctx.get("lineup", [])
-    for p in lineup:
-        play_prob = p.get("play_prob", 1.0)
-        inactive_prob = cfg["lineup_uncertainty"].get("inactive_prob_default", 0.06)
-        star_boost = cfg["lineup_uncertainty"].get("star_player_boost", 0.5)
-        if p.get("is_star", False):
-            inactive_prob *= (1 - star_boost)
-        p["play_prob"] = max(0.0, min(1.0, play_prob * (1 - inactive_prob)))
+    inactive_prob_default = cfg["lineup_uncertainty"].get("inactive_prob_default", 0.06)
+    star_boost = cfg["lineup_uncertainty"].get("star_player_boost", 0.5)
+
+    if np is not None and lineup:
+        play_probs = np.array([p.get("play_prob", 1.0) for p in lineup], dtype=float)
+        inactive = np.full(len(lineup), inactive_prob_default)
+        stars = np.array([bool(p.get("is_star", False)) for p in lineup])
+        inactive[stars] *= (1 - star_boost)
+        adjusted = np.clip(play_probs * (1 - inactive), 0.0, 1.0)
+        for p, v in zip(lineup, adjusted):
+            p["play_prob"] = float(v)
+    else:
+        for p in lineup:
+            inactive_prob = inactive_prob_default
+            if p.get("is_star", False):
+                inactive_prob *= (1 - star_boost)
+            p["play_prob"] = clamp(p.get("play_prob", 1.0) * (1 - inactive_prob), 0.0, 1.0)
     ctx["lineup"] = lineup
-    return ctx
\ No newline at end of file
+    return ctx
+
+# Precompiled dispatch order for the master call; append new stabilizers here.
+# Each entry pairs the handler with its config key (handlers keep their own
+# enabled guard for standalone use).
+STABILIZER_CHAIN = (
+    ("inning_cluster_dampener", inning_cluster_dampener),
+    ("relief_chain_normalizer", relief_chain_normalizer),
+    ("hr_spike_flag", hr_spike_flag),
+    ("umpire_bounds", umpire_bounds),
+    ("lineup_uncertainty", lineup_uncertainty),
+)
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
+from sim import clamp
 
-@dataclass
+
+@dataclass(slots=True)
 class PaceContext:
     """
     Game-level pace context modifiers.
@@ -14,7 +17,7 @@ class PaceContext:
     playoff_intensity: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamPaceProfile:
     """
     Minimal pace profile for one team.
@@ -30,20 +33,35 @@ class TeamPaceProfile:
     long_reb_three_rate: float        # fraction of FGA that are 3s or long mid (0.0–1.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class GamePaceInputs:
     home: TeamPaceProfile
     away: TeamPaceProfile
-    context: PaceContext = PaceContext()
+    context: PaceContext = field(default_factory=PaceContext)
+
+
+@lru_cache(maxsize=512)
+def _blend_pace_values(home_base: float, home_last10: float,
+                       away_base: float, away_last10: float) -> float:
+    home_blend = 0.65 * home_base + 0.35 * home_last10
+    away_blend = 0.65 * away_base + 0.35 * away_last10
+    return (home_blend + away_blend) / 2.0
 
 
 def _blend_baseline_pace(home: TeamPaceProfile, away: TeamPaceProfile) -> float:
     """
     Blend season and last-10 pace for both teams and average.
+    Cached on the four pace numbers: backtests re-price the same
+    matchups repeatedly.
     """
-    home_blend = 0.65 * home.base_pace + 0.35 * home.last10_pace
-    away_blend = 0.65 * away.base_pace + 0.35 * away.last10_pace
-    return (home_blend + away_blend) / 2.0
+    return _blend_pace_values(home.base_pace, home.last10_pace,
+                              away.base_pace, away.last10_pace)
+
+
+# Rough league anchors (freq ~0.16, eff ~1.20, long_reb_three_rate ~0.45),
+# folded into reciprocal constants so the per-game path is multiply-only.
+_INV_TWO_ANCHOR_FREQ_EFF = 1.0 / (2 * 0.16 * 1.20)
+_INV_LONG_REB_ANCHOR = 1.0 / 0.45
 
 
 def _transition_pressure_adjustment(home: TeamPaceProfile, away: TeamPaceProfile) -> float:
@@ -63,19 +81,16 @@ def _transition_pressure_adjustment(home: TeamPaceProfile, away: TeamPaceProfile
     # Long rebound environment from 3s / long mid
     long_reb_env = (home.long_reb_three_rate + away.long_reb_three_rate) / 2.0
 
-    # Normalize against rough league anchors
-    # (freq ~0.16, eff ~1.20, long_reb_three_rate ~0.45)
-    anchor_freq_eff = 0.16 * 1.20
-    off_delta = ((off_pressure_home + off_pressure_away) / (2 * anchor_freq_eff)) - 1.0
-    def_delta = ((def_leak_home + def_leak_away) / (2 * anchor_freq_eff)) - 1.0
-    long_reb_delta = (long_reb_env / 0.45) - 1.0
+    # Normalize against the precomputed league anchors
+    off_delta = (off_pressure_home + off_pressure_away) * _INV_TWO_ANCHOR_FREQ_EFF - 1.0
+    def_delta = (def_leak_home + def_leak_away) * _INV_TWO_ANCHOR_FREQ_EFF - 1.0
+    long_reb_delta = long_reb_env * _INV_LONG_REB_ANCHOR - 1.0
 
     # Weight them
     raw = 0.45 * off_delta + 0.35 * def_delta + 0.20 * long_reb_delta
 
     # Clamp so pace multiplier never goes crazy
-    raw = max(-0.10, min(0.10, raw))
-    return 1.0 + raw
+    return 1.0 + clamp(raw, -0.10, 0.10)
 
 
 def _context_adjustment_multiplier(ctx: PaceContext) -> float:
@@ -106,8 +121,7 @@ def _context_adjustment_multiplier(ctx: PaceContext) -> float:
     if ctx.playoff_intensity:
         adj -= 0.02
 
-    adj = max(-0.05, min(0.05, adj))
-    return 1.0 + adj
+    return 1.0 + clamp(adj, -0.05, 0.05)
 
 
 def predict_pace(inputs: GamePaceInputs) -> float:
@@ -126,4 +140,52 @@ def predict_pace(inputs: GamePaceInputs) -> float:
 
     # Clamp to a realistic band for most NBA games
     # This is per-team possessions.
-    return max(92.0, min(110.0, raw_pace))
\ No newline at end of file
+    return clamp(raw_pace, 92.0, 110.0)
+
+def predict_pace_batch(games):
+    """
+    Vectorized predict_pace over a sequence of GamePaceInputs.
+    Runs the blend / transition-pressure / context math as one NumPy
+    kernel for the whole slate and returns an array of per-team
+    possessions (same clamps as the scalar path).
+    """
+    import numpy as np
+
+    def col(fn):
+        return np.array([fn(g) for g in games], dtype=float)
+
+    base = 0.5 * (
+        0.65 * col(lambda g: g.home.base_pace) + 0.35 * col(lambda g: g.home.last10_pace)
+        + 0.65 * col(lambda g: g.away.base_pace) + 0.35 * col(lambda g: g.away.last10_pace)
+    )
+
+    off_pressure = (
+        col(lambda g: g.home.transition_freq_off) * col(lambda g: g.home.transition_eff_off)
+        + col(lambda g: g.away.transition_freq_off) * col(lambda g: g.away.transition_eff_off)
+    )
+    def_leak = (
+        col(lambda g: g.home.transition_freq_def) * col(lambda g: g.home.transition_eff_def)
+        + col(lambda g: g.away.transition_freq_def) * col(lambda g: g.away.transition_eff_def)
+    )
+    long_reb_env = 0.5 * (
+        col(lambda g: g.home.long_reb_three_rate) + col(lambda g: g.away.long_reb_three_rate)
+    )
+
+    raw = (
+        0.45 * (off_pressure * _INV_TWO_ANCHOR_FREQ_EFF - 1.0)
+        + 0.35 * (def_leak * _INV_TWO_ANCHOR_FREQ_EFF - 1.0)
+        + 0.20 * (long_reb_env * _INV_LONG_REB_ANCHOR - 1.0)
+    )
+    trans_mult = 1.0 + np.clip(raw, -0.10, 0.10)
+
+    spread = col(lambda g: g.context.projected_close_spread)
+    adj = (
+        -0.02 * col(lambda g: g.context.is_back_to_back_home)
+        - 0.02 * col(lambda g: g.context.is_back_to_back_away)
+        + 0.02 * col(lambda g: g.context.altitude_game)
+        - 0.02 * col(lambda g: g.context.playoff_intensity)
+        + np.where(spread <= 4.0, 0.02, np.where(spread >= 10.0, -0.01, 0.0))
+    )
+    ctx_mult = 1.0 + np.clip(adj, -0.05, 0.05)
+
+    return np.clip(base * trans_mult * ctx_mult, 92.0, 110.0)
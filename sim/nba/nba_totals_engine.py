@@ -1,17 +1,37 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 
 from .nba_pace_model import (
     predict_pace,
+    predict_pace_batch,
     GamePaceInputs,
     TeamPaceProfile,
     PaceContext,
 )
-from .transition_patch import apply_transition_total_patch
-from .sim.nba.hv_totals_guardrail import HVInputs, compute_hv_guardrail, hv_to_dict
+from .transition_patch import (
+    apply_transition_total_patch,
+    apply_transition_total_patch_batch,
+)
+from .sim.nba.hv_totals_guardrail import (
+    HVInputs,
+    compute_hv_guardrail,
+    compute_hv_guardrail_batch,
+    hv_to_dict,
+)
+
+# Combined off/def rating -> points per possession (each side is per 100
+# possessions, so the sum divides by 200).
+_PPP_SCALE = 1.0 / 200.0
+
+# Monte Carlo environment for the projected-median estimate.
+_MC_DRAWS = 4096
+_MC_OT_PROB = 0.065        # ~6.5% of NBA games reach at least one OT
+_MC_OT_POINTS = 13.0       # average extra points an OT period adds
+_MC_BASE_SIGMA = 13.5      # stdev of totals vs projection
+_MC_SIGMA_PER_RISK = 0.95  # widen with HV risk score
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamProfile:
     pace: float               # possessions per game
     off_rating: float         # points per 100 poss
@@ -28,7 +48,7 @@ class TeamProfile:
     is_b2b: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GameInputs:
     home: TeamProfile
     away: TeamProfile
@@ -60,38 +80,61 @@ class NBATotalsEngine:
             long_reb_three_rate=team.long_reb_three_rate,
         )
 
+    @staticmethod
+    def _final_total_median(final_mean: float, hv_risk_score: float) -> float:
+        """
+        Median via a vectorized quantile over Monte Carlo draws instead of
+        the old flat 0.98 haircut. The draw environment is a normal body
+        around the regulation mean plus an OT tail on the upside, which is
+        what pulls the median under the mean in the first place.
+        """
+        try:
+            import numpy as np
+        except Exception:
+            return final_mean * 0.98
+
+        sigma = min(19.5, max(12.0, _MC_BASE_SIGMA + _MC_SIGMA_PER_RISK * hv_risk_score))
+        regulation_mean = final_mean - _MC_OT_PROB * _MC_OT_POINTS
+        rng = np.random.default_rng(0)
+        draws = regulation_mean + sigma * rng.standard_normal(_MC_DRAWS)
+        draws[rng.random(_MC_DRAWS) < _MC_OT_PROB] += _MC_OT_POINTS
+        return float(np.quantile(draws, 0.5))
+
     @staticmethod
     def simulate_total(inputs: GameInputs) -> Dict[str, Any]:
+        # Unpack once: the profiles are read a dozen times below.
+        home, away = inputs.home, inputs.away
+
         context = inputs.context or PaceContext(
-            is_back_to_back_home=inputs.home.is_b2b,
-            is_back_to_back_away=inputs.away.is_b2b,
-            projected_close_spread=abs(inputs.home.spread),
+            is_back_to_back_home=home.is_b2b,
+            is_back_to_back_away=away.is_b2b,
+            projected_close_spread=abs(home.spread),
         )
 
         pace_inputs = GamePaceInputs(
-            home=NBATotalsEngine._to_pace_profile(inputs.home),
-            away=NBATotalsEngine._to_pace_profile(inputs.away),
+            home=NBATotalsEngine._to_pace_profile(home),
+            away=NBATotalsEngine._to_pace_profile(away),
             context=context,
         )
 
         base_pace = predict_pace(pace_inputs)
 
-        home_ppp = (inputs.home.off_rating + inputs.away.def_rating) / 200.0
-        away_ppp = (inputs.away.off_rating + inputs.home.def_rating) / 200.0
+        home_ppp = (home.off_rating + away.def_rating) * _PPP_SCALE
+        away_ppp = (away.off_rating + home.def_rating) * _PPP_SCALE
         raw_total = (home_ppp + away_ppp) * base_pace
 
         transition_patched_total = apply_transition_total_patch(
             base_total=raw_total,
-            off_freq=inputs.home.trans_freq,
-            off_eff=inputs.home.trans_eff,
-            def_freq=inputs.away.def_trans_freq,
-            def_eff=inputs.away.def_trans_eff,
+            off_freq=home.trans_freq,
+            off_eff=home.trans_eff,
+            def_freq=away.def_trans_freq,
+            def_eff=away.def_trans_eff,
         )
         transition_delta = transition_patched_total - raw_total
 
         hv_result = compute_hv_guardrail(transition_patched_total, inputs.hv_inputs)
         final_mean = transition_patched_total + hv_result.volatility_boost
-        final_median = final_mean * 0.98
+        final_median = NBATotalsEngine._final_total_median(final_mean, hv_result.risk_score)
 
         output: Dict[str, Any] = {
             "pace": base_pace,
@@ -105,3 +148,74 @@ class NBATotalsEngine:
         }
         output.update(hv_to_dict(hv_result))
         return output
+
+    @staticmethod
+    def simulate_totals_batch(batch: "List[GameInputs]") -> "List[Dict[str, Any]]":
+        """
+        Vectorized simulate_total over a whole slate.
+
+        Pace, efficiency, and the transition patch run as struct-of-arrays
+        NumPy kernels; the HV guardrail (flag-heavy, per-matchup context)
+        stays per game on top of the vectorized totals.
+        """
+        import numpy as np
+
+        if not batch:
+            return []
+
+        contexts = [
+            inputs.context or PaceContext(
+                is_back_to_back_home=inputs.home.is_b2b,
+                is_back_to_back_away=inputs.away.is_b2b,
+                projected_close_spread=abs(inputs.home.spread),
+            )
+            for inputs in batch
+        ]
+        pace_inputs = [
+            GamePaceInputs(
+                home=NBATotalsEngine._to_pace_profile(inputs.home),
+                away=NBATotalsEngine._to_pace_profile(inputs.away),
+                context=ctx,
+            )
+            for inputs, ctx in zip(batch, contexts)
+        ]
+        base_pace = predict_pace_batch(pace_inputs)
+
+        def col(fn):
+            return np.array([fn(g) for g in batch], dtype=float)
+
+        home_ppp = (col(lambda g: g.home.off_rating) + col(lambda g: g.away.def_rating)) * _PPP_SCALE
+        away_ppp = (col(lambda g: g.away.off_rating) + col(lambda g: g.home.def_rating)) * _PPP_SCALE
+        raw_total = (home_ppp + away_ppp) * base_pace
+
+        patched = apply_transition_total_patch_batch(
+            raw_total,
+            col(lambda g: g.home.trans_freq),
+            col(lambda g: g.home.trans_eff),
+            col(lambda g: g.away.def_trans_freq),
+            col(lambda g: g.away.def_trans_eff),
+        )
+
+        hv_results = compute_hv_guardrail_batch(patched, [g.hv_inputs for g in batch])
+
+        results: "List[Dict[str, Any]]" = []
+        for i, inputs in enumerate(batch):
+            patched_i = float(patched[i])
+            raw_i = float(raw_total[i])
+            hv_result = hv_results[i]
+            final_mean = patched_i + hv_result.volatility_boost
+            output: Dict[str, Any] = {
+                "pace": float(base_pace[i]),
+                "home_ppp": float(home_ppp[i]),
+                "away_ppp": float(away_ppp[i]),
+                "raw_total": raw_i,
+                "transition_patched_total": patched_i,
+                "transition_delta": patched_i - raw_i,
+                "final_total_mean": final_mean,
+                "final_total_median": NBATotalsEngine._final_total_median(
+                    final_mean, hv_result.risk_score
+                ),
+            }
+            output.update(hv_to_dict(hv_result))
+            results.append(output)
+        return results
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class HVInputs:
     """
     Inputs describing the volatility context of a game.
@@ -35,7 +35,13 @@ class HVInputs:
     halfcourt_defense_weak_tier: float = 0.5# how weak the combined halfcourt defense is
 
 
-@dataclass
+# Clamp / translation constants shared by the scalar and batch paths.
+_MAX_SCORE = 6.0
+_BOOST_PCT_PER_SCORE = 0.015  # 1.5% of base_total per score unit
+_MAX_BOOST_POINTS = 8.0       # never add more than 8 points from guardrail
+
+
+@dataclass(slots=True)
 class HVResult:
     risk_score: float
     volatility_boost: float
@@ -64,46 +70,33 @@ def compute_hv_guardrail(base_total: float, hv: Optional[HVInputs]) -> HVResult:
             under_cap_active=False,
         )
 
-    score = 0.0
-
-    # 1) Flag-based contributions
-    if hv.high_shot_makers:
-        score += 1.2
-    if hv.high_transition_risk:
-        score += 1.0
-    if hv.low_tov_environment:
-        score += 0.8
-    if hv.high_three_volume_matchup:
-        score += 1.0
-
-    # Recent crazy overs (+20 vs closing) matter a lot
-    if hv.recent_extreme_overs >= 1:
-        score += 0.7
-    if hv.recent_extreme_overs >= 2:
-        score += 0.5
-
-    # 2) Percentile-based contributions
-    # Pace – reward very fast games
-    if hv.pace_tier > 0.70:
-        score += 0.6
-    if hv.pace_tier > 0.85:
-        score += 0.4
-
-    # Strong halfcourt offense AND weak halfcourt defense together are dangerous
+    # Branchless additive scoring: every condition contributes weight *
+    # bool, so the whole block is one expression with no branches for the
+    # interpreter (or a future vectorizer) to trip on.
     combined_halfcourt = 0.5 * (hv.halfcourt_offense_tier + hv.halfcourt_defense_weak_tier)
-    if combined_halfcourt > 0.65:
-        score += 0.6
-    if combined_halfcourt > 0.80:
-        score += 0.5
+    score = (
+        # 1) Flag-based contributions
+        1.2 * hv.high_shot_makers
+        + 1.0 * hv.high_transition_risk
+        + 0.8 * hv.low_tov_environment
+        + 1.0 * hv.high_three_volume_matchup
+        # Recent crazy overs (+20 vs closing) matter a lot
+        + 0.7 * (hv.recent_extreme_overs >= 1)
+        + 0.5 * (hv.recent_extreme_overs >= 2)
+        # 2) Percentile-based contributions (pace - reward very fast games)
+        + 0.6 * (hv.pace_tier > 0.70)
+        + 0.4 * (hv.pace_tier > 0.85)
+        # Strong halfcourt offense AND weak halfcourt defense are dangerous
+        + 0.6 * (combined_halfcourt > 0.65)
+        + 0.5 * (combined_halfcourt > 0.80)
+    )
 
-    # Clamp score to a reasonable range
-    score = max(0.0, min(score, 6.0))
+    # Clamp score to a reasonable range (branchless min/max pair)
+    score = max(0.0, min(score, _MAX_SCORE))
 
     # 3) Translate score into a volatility boost in points
     # Rough rule: each point of score ~ 1.5–2.0 pts on total, capped.
-    boost = base_total * (0.015 * score)  # 1.5% of base_total per score unit
-    max_boost = 8.0                       # never add more than 8 points from guardrail
-    boost = max(0.0, min(boost, max_boost))
+    boost = max(0.0, min(base_total * (_BOOST_PCT_PER_SCORE * score), _MAX_BOOST_POINTS))
 
     # 4) Under-cap logic
     # If risk_score is high, we mark unders as "dangerous unless edge >= ~62%"
@@ -125,4 +118,49 @@ def hv_to_dict(result: HVResult) -> Dict[str, Any]:
         "hv_risk_score": result.risk_score,
         "hv_volatility_boost": result.volatility_boost,
         "hv_under_cap_active": result.under_cap_active,
-    }
\ No newline at end of file
+    }
+
+def compute_hv_guardrail_batch(base_totals, hv_list):
+    """
+    Vectorized compute_hv_guardrail for batch backtests: score, boost, and
+    under-cap come out of one NumPy expression across the whole slate.
+    None entries get the no-adjustment result, same as the scalar path.
+    """
+    import numpy as np
+
+    base = np.asarray(base_totals, dtype=float)
+    has_ctx = np.array([hv is not None for hv in hv_list])
+
+    def col(fn, default=0.0):
+        return np.array(
+            [fn(hv) if hv is not None else default for hv in hv_list],
+            dtype=float,
+        )
+
+    combined_halfcourt = 0.5 * (
+        col(lambda hv: hv.halfcourt_offense_tier, 0.5)
+        + col(lambda hv: hv.halfcourt_defense_weak_tier, 0.5)
+    )
+    recent = col(lambda hv: hv.recent_extreme_overs)
+    pace_tier = col(lambda hv: hv.pace_tier, 0.5)
+
+    score = (
+        1.2 * col(lambda hv: hv.high_shot_makers)
+        + 1.0 * col(lambda hv: hv.high_transition_risk)
+        + 0.8 * col(lambda hv: hv.low_tov_environment)
+        + 1.0 * col(lambda hv: hv.high_three_volume_matchup)
+        + 0.7 * (recent >= 1)
+        + 0.5 * (recent >= 2)
+        + 0.6 * (pace_tier > 0.70)
+        + 0.4 * (pace_tier > 0.85)
+        + 0.6 * (combined_halfcourt > 0.65)
+        + 0.5 * (combined_halfcourt > 0.80)
+    )
+    score = np.where(has_ctx, np.clip(score, 0.0, _MAX_SCORE), 0.0)
+    boost = np.where(has_ctx, np.clip(base * (_BOOST_PCT_PER_SCORE * score), 0.0, _MAX_BOOST_POINTS), 0.0)
+    under_cap = score >= 3.0
+
+    return [
+        HVResult(risk_score=float(s), volatility_boost=float(b), under_cap_active=bool(u))
+        for s, b, u in zip(score, boost, under_cap)
+    ]
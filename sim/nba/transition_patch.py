@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import partial
 
 
 @dataclass
@@ -22,9 +23,15 @@ class TransitionConfig:
     MAX_ADJ: float = 0.08
 
 
+# One shared default config: Python builds default arguments once at def
+# time, but the two functions each held their own instance; fold them into
+# a single module-level default.
+_DEFAULT_CONFIG = TransitionConfig()
+
+
 def _transition_multiplier(freq: float,
                            eff: float,
-                           cfg: TransitionConfig = TransitionConfig()) -> float:
+                           cfg: TransitionConfig = _DEFAULT_CONFIG) -> float:
     """
     Turn one side's transition profile into a multiplier.
     freq = proportion of plays in transition (0.0–0.4)
@@ -33,19 +40,18 @@ def _transition_multiplier(freq: float,
     if not cfg.ENABLED:
         return 1.0
 
-    if cfg.FREQ_REF <= 0 or cfg.EFF_REF <= 0:
+    freq_ref, eff_ref = cfg.FREQ_REF, cfg.EFF_REF
+    if freq_ref <= 0 or eff_ref <= 0:
         return 1.0
 
-    # Relative deltas vs league baselines
-    freq_delta = (freq / cfg.FREQ_REF) - 1.0
-    eff_delta = (eff / cfg.EFF_REF) - 1.0
-
-    raw_adj = cfg.FREQ_WEIGHT * freq_delta + cfg.EFF_WEIGHT * eff_delta
+    # Relative deltas vs league baselines, folded into one expression so
+    # the per-play hot path is a handful of arithmetic ops.
+    raw_adj = (cfg.FREQ_WEIGHT * (freq / freq_ref - 1.0)
+               + cfg.EFF_WEIGHT * (eff / eff_ref - 1.0))
 
     # Clamp so we never explode the total
-    clamped = max(-cfg.MAX_ADJ, min(cfg.MAX_ADJ, raw_adj))
-
-    return 1.0 + clamped
+    max_adj = cfg.MAX_ADJ
+    return 1.0 + max(-max_adj, min(max_adj, raw_adj))
 
 
 def apply_transition_total_patch(
@@ -54,7 +60,7 @@ def apply_transition_total_patch(
     off_eff: float,
     def_freq: float,
     def_eff: float,
-    cfg: TransitionConfig = TransitionConfig(),
+    cfg: TransitionConfig = _DEFAULT_CONFIG,
 ) -> float:
     """
     Patch a **game total** using transition profiles for both teams.
@@ -74,10 +80,183 @@ def apply_transition_total_patch(
     if not cfg.ENABLED:
         return base_total
 
-    off_mult = _transition_multiplier(off_freq, off_eff, cfg)
-    def_mult = _transition_multiplier(def_freq, def_eff, cfg)
+    if cfg is _DEFAULT_CONFIG:
+        # Common case: the default config's constants were partially
+        # evaluated at import, so this path is pure arithmetic.
+        return _default_patch_kernel(base_total, off_freq, off_eff, def_freq, def_eff)
+
+    freq_ref, eff_ref = cfg.FREQ_REF, cfg.EFF_REF
+    if freq_ref <= 0 or eff_ref <= 0:
+        return base_total
+
+    return _patch_kernel(
+        base_total, off_freq, off_eff, def_freq, def_eff,
+        inv_freq_ref=1.0 / freq_ref,
+        inv_eff_ref=1.0 / eff_ref,
+        freq_w=cfg.FREQ_WEIGHT,
+        eff_w=cfg.EFF_WEIGHT,
+        max_adj=cfg.MAX_ADJ,
+    )
+
+
+def _patch_kernel(
+    base_total: float,
+    off_freq: float,
+    off_eff: float,
+    def_freq: float,
+    def_eff: float,
+    *,
+    inv_freq_ref: float,
+    inv_eff_ref: float,
+    freq_w: float,
+    eff_w: float,
+    max_adj: float,
+) -> float:
+    # Fused form of the off/def _transition_multiplier pair: both
+    # adjustments, then the blended multiplier (1 + (off + def)/2).
+    off_adj = freq_w * (off_freq * inv_freq_ref - 1.0) + eff_w * (off_eff * inv_eff_ref - 1.0)
+    def_adj = freq_w * (def_freq * inv_freq_ref - 1.0) + eff_w * (def_eff * inv_eff_ref - 1.0)
+    off_adj = max(-max_adj, min(max_adj, off_adj))
+    def_adj = max(-max_adj, min(max_adj, def_adj))
+    return base_total * (1.0 + 0.5 * (off_adj + def_adj))
+
+
+# Partial evaluation of the default config: reciprocal refs and weights are
+# bound once at import, so default-config calls skip all attribute reads.
+_default_patch_kernel = partial(
+    _patch_kernel,
+    inv_freq_ref=1.0 / _DEFAULT_CONFIG.FREQ_REF,
+    inv_eff_ref=1.0 / _DEFAULT_CONFIG.EFF_REF,
+    freq_w=_DEFAULT_CONFIG.FREQ_WEIGHT,
+    eff_w=_DEFAULT_CONFIG.EFF_WEIGHT,
+    max_adj=_DEFAULT_CONFIG.MAX_ADJ,
+)
+
+# ---------------------------------------------------------------------------
+# Pace-side volatility multiplier (formerly the root-level transition_patch)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PaceTransitionConfig:
+    """
+    Config for transition + pace volatility adjustments.
+    """
+    ENABLED: bool = True
+
+    # Baseline possessions per team we normalize to
+    BASE_PACE: float = 98.0
+
+    # How strongly live-rebound and steal-based transition
+    # increase pace and scoring opportunities.
+    LIVE_REB_FREQ_BOOST: float = 0.35
+    STEAL_FREQ_BOOST: float = 0.25
+
+    # How much high 3PA volume amplifies pace inflation.
+    THREE_VOL_BOOST: float = 0.20
+
+    # Hard cap on how far we let the multiplier move
+    # away from 1.0 in either direction (±15%).
+    MAX_PACE_DELTA: float = 0.15
+
+
+_DEFAULT_PACE_CONFIG = PaceTransitionConfig()
+
+# League-pace inverse for the default config: the hot path multiplies
+# instead of dividing (the volatility terms are already plain adds).
+_DEFAULT_INV_BASE_PACE = 1.0 / _DEFAULT_PACE_CONFIG.BASE_PACE
+
+
+def transition_pace_multiplier(
+    poss_per_team: float,
+    live_reb_trans_freq: float,
+    steal_trans_freq: float,
+    three_rate: float,
+    cfg: PaceTransitionConfig = _DEFAULT_PACE_CONFIG,
+) -> float:
+    """
+    Compute a pace multiplier based on:
+      - overall possessions per team
+      - how often teams run off live rebounds
+      - how often they run off steals
+      - how three-heavy the shot profile is
+
+    The result is a capped multiplier that can bump totals
+    up or down but never lets volatility completely explode.
+    """
+    if not cfg.ENABLED:
+        return 1.0
+
+    # Normalize pace to a baseline season value.
+    if cfg is _DEFAULT_PACE_CONFIG:
+        base_ratio = poss_per_team * _DEFAULT_INV_BASE_PACE
+    else:
+        base_ratio = poss_per_team / cfg.BASE_PACE
+
+    # Volatility terms
+    live_term = cfg.LIVE_REB_FREQ_BOOST * live_reb_trans_freq
+    steal_term = cfg.STEAL_FREQ_BOOST * steal_trans_freq
+    three_term = cfg.THREE_VOL_BOOST * three_rate
+
+    raw_multiplier = base_ratio * (1.0 + live_term + steal_term + three_term)
+
+    # Clamp to keep sims realistic.
+    lower = 1.0 - cfg.MAX_PACE_DELTA
+    upper = 1.0 + cfg.MAX_PACE_DELTA
+    return max(lower, min(upper, raw_multiplier))
+
+
+# ---------------------------------------------------------------------------
+# Legacy adapter
+# ---------------------------------------------------------------------------
+
+def compute_transition_delta(inputs, cfg: TransitionConfig = _DEFAULT_CONFIG) -> float:
+    """
+    Adapter for the legacy sim/nba_totals_engine: returns the point delta
+    the transition patch would add to that engine's raw total.
+    """
+    home, away = inputs.home, inputs.away
+    base_pace = (home.pace + away.pace) / 2.0
+    home_ppp = (home.off_rating + away.def_rating) / 200.0
+    away_ppp = (away.off_rating + home.def_rating) / 200.0
+    raw_total = (home_ppp + away_ppp) * base_pace
+    patched = apply_transition_total_patch(
+        raw_total,
+        home.trans_freq, home.trans_eff,
+        away.def_trans_freq, away.def_trans_eff,
+        cfg,
+    )
+    return patched - raw_total
+
+
+def apply_transition_total_patch_batch(
+    base_totals,
+    off_freq,
+    off_eff,
+    def_freq,
+    def_eff,
+    cfg: TransitionConfig = _DEFAULT_CONFIG,
+):
+    """
+    Ufunc-style apply_transition_total_patch: every argument may be an
+    aligned array (one entry per game) and the patched totals come back as
+    one NumPy array for batch slate evaluation.
+    """
+    import numpy as np
 
-    # Simple blend – we can get fancier later if needed
-    combined_mult = (off_mult + def_mult) / 2.0
+    base = np.asarray(base_totals, dtype=float)
+    if not cfg.ENABLED or cfg.FREQ_REF <= 0 or cfg.EFF_REF <= 0:
+        return base
 
-    return base_total * combined_mult
\ No newline at end of file
+    inv_freq_ref = 1.0 / cfg.FREQ_REF
+    inv_eff_ref = 1.0 / cfg.EFF_REF
+    off_adj = np.clip(
+        cfg.FREQ_WEIGHT * (np.asarray(off_freq, dtype=float) * inv_freq_ref - 1.0)
+        + cfg.EFF_WEIGHT * (np.asarray(off_eff, dtype=float) * inv_eff_ref - 1.0),
+        -cfg.MAX_ADJ, cfg.MAX_ADJ,
+    )
+    def_adj = np.clip(
+        cfg.FREQ_WEIGHT * (np.asarray(def_freq, dtype=float) * inv_freq_ref - 1.0)
+        + cfg.EFF_WEIGHT * (np.asarray(def_eff, dtype=float) * inv_eff_ref - 1.0),
+        -cfg.MAX_ADJ, cfg.MAX_ADJ,
+    )
+    return base * (1.0 + 0.5 * (off_adj + def_adj))
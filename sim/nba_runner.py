@@ -21,10 +21,15 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from sim import clamp
 from sim.nba.nba_totals_engine import NBATotalsEngine, GameInputs, TeamProfile
 from sim.nba.nba_pace_model import PaceContext
 from sim.nba.sim.nba.hv_totals_guardrail import HVInputs
 
+# One clock read per sweep: every per-game row and the slate payload share
+# the same run timestamp.
+RUN_TS_UTC = datetime.now(timezone.utc).isoformat()
+
 DEFAULT_INPUTS_PATH = "config/nba.slate.2026-04-30.json"
 FALLBACK_INPUTS_PATH = "config/nba.inputs.sample.json"
 DEFAULT_OUTPUTS_DIR = "outputs/nba/_wire_test"
@@ -47,10 +52,6 @@ def normal_cdf(x: float) -> float:
     return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
 
 
-def clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
-
-
 def american_fair_odds(probability: float) -> int:
     p = clamp(probability, 0.001, 0.999)
     if p >= 0.5:
@@ -168,7 +169,7 @@ def simulate_nba(inputs: Dict[str, Any]) -> Dict[str, Any]:
         "game": inputs["game"],
         "sport": "nba",
         "mode": inputs.get("mode", "B003_NBA_TOTALS_PREFLIGHT"),
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "timestamp_utc": RUN_TS_UTC,
         "simulated": True,
         "model_version": "NBA_B003_MAIN_ENGINE_ADAPTER_V1",
         "engine_status": {
@@ -243,7 +244,7 @@ def run_simulation() -> None:
             "slate_date": inputs.get("slate_date"),
             "sport": "nba",
             "mode": inputs.get("mode", "B003_NBA_SLATE_PREFLIGHT"),
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": RUN_TS_UTC,
             "data_quality_note": inputs.get("data_quality_note"),
             "summary": summarize_slate(results),
             "results": results,
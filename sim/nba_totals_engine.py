@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from .transition_patch import compute_transition_delta
+from .nba.transition_patch import compute_transition_delta
 
-@dataclass
+# Combined off/def rating -> points per possession (ratings are per 100
+# possessions for each side, so the sum divides by 200).
+_PPP_SCALE = 1.0 / 200.0
+
+@dataclass(slots=True)
 class TeamProfile:
     pace: float               # possessions per game
     off_rating: float         # points per 100 poss
@@ -11,7 +15,7 @@ class TeamProfile:
     def_trans_freq: float     # allowed transition freq
     def_trans_eff: float      # allowed transition eff
 
-@dataclass
+@dataclass(slots=True)
 class GameInputs:
     home: TeamProfile
     away: TeamProfile
@@ -27,12 +31,14 @@ class NBATotalsEngine:
         - transition patch overlay
         """
 
+        home, away = inputs.home, inputs.away
+
         # 1) Base possessions estimate
-        base_pace = (inputs.home.pace + inputs.away.pace) / 2
+        base_pace = 0.5 * (home.pace + away.pace)
 
         # 2) Base offensive expectation (points per possession)
-        home_ppp = (inputs.home.off_rating + inputs.away.def_rating) / 200
-        away_ppp = (inputs.away.off_rating + inputs.home.def_rating) / 200
+        home_ppp = (home.off_rating + away.def_rating) * _PPP_SCALE
+        away_ppp = (away.off_rating + home.def_rating) * _PPP_SCALE
 
         # 3) Apply transition patch
         transition_delta = compute_transition_delta(inputs)
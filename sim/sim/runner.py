@@ -1,16 +1,42 @@
 import json, os, datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+RUN_STAMP = datetime.datetime.now().isoformat()
 
 # Default paths (you can change these or pass as CLI args later)
 DEFAULT_CONFIG_PATH = "config/model.defaults.json"
 DEFAULT_INPUTS_PATH = "config/inputs.sample.json"
 DEFAULT_OUTPUTS_DIR = "outputs/_wire_test"
 
-def load_json(path):
+@lru_cache(maxsize=32)
+def _load_json_mtime(path, mtime):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r") as f:
         return json.load(f)
 
+def load_json(path):
+    # mtime keys the cache so repeat loads reuse the parse until the file
+    # changes on disk.
+    return _load_json_mtime(path, os.path.getmtime(path))
+
+_ensured_dirs = set()
+
 def save_json(data, path):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    dir_ = os.path.dirname(path)
+    if dir_ not in _ensured_dirs:
+        os.makedirs(dir_, exist_ok=True)
+        _ensured_dirs.add(dir_)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
 
@@ -28,7 +54,7 @@ def run_simulation():
     # Basic mock output (we’ll later replace this with model logic)
     result = {
         "game": inputs["game"],
-        "timestamp": datetime.datetime.now().isoformat(),
+        "timestamp": RUN_STAMP,
         "simulated": True,
         "total_runs_pred": 7.6,
         "home_win_prob": 0.57,
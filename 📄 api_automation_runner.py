@@ -1,12 +1,26 @@
 import json
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 load_dotenv()
 
 CONFIG_PATH = "comprehensive_api_automation_v1.1_config.json"
 
+# One pooled session for the whole feed loop so keep-alive connections
+# are reused instead of re-handshaking TLS per feed.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 def fetch_and_store(feed):
     source = feed["source"]
     method = feed.get("method", "GET")
@@ -17,14 +31,23 @@ def fetch_and_store(feed):
         headers["Authorization"] = f"Bearer {os.getenv('API_KEY')}"
 
     print(f"📡 Fetching data from: {source}")
-    response = requests.request(method, source, headers=headers)
+    response = SESSION.request(method, source, headers=headers)
 
     if response.status_code == 200:
         data = response.json()
         out_path = feed["storage_path"]
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        with open(out_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Compact single-pass serialize straight to the fd; these files are
+        # machine-read, so no indent pass.
+        if orjson is not None:
+            fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, orjson.dumps(data))
+            finally:
+                os.close(fd)
+        else:
+            with open(out_path, "w") as f:
+                json.dump(data, f)
         print(f"✅ Saved to: {out_path}")
     else:
         print(f"❌ Failed with status {response.status_code}: {response.text}")
@@ -37,9 +60,18 @@ def main():
         print("⚠️ Protocol is disabled in config.")
         return
 
-    for feed_name, feed_config in config.get("data_feeds", {}).items():
-        print(f"\n🔄 Starting fetch: {feed_name}")
-        fetch_and_store(feed_config)
+    # Fetch all feeds concurrently over the pooled session; the network
+    # waits overlap instead of running one feed at a time.
+    feeds = list(config.get("data_feeds", {}).items())
+    if not feeds:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(feeds))) as pool:
+        futures = []
+        for feed_name, feed_config in feeds:
+            print(f"🔄 Starting fetch: {feed_name}")
+            futures.append(pool.submit(fetch_and_store, feed_config))
+    for fut in futures:
+        fut.result()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file